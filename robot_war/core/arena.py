@@ -1,7 +1,8 @@
 """Arena class - manages the game grid, obstacles, mines, and positioning."""
 
-from typing import List, Tuple, Optional, Set
+from typing import AbstractSet, Dict, List, Tuple, Optional, Set
 from enum import Enum
+from functools import lru_cache
 import random
 
 
@@ -23,15 +24,48 @@ class Direction(Enum):
     NW = (-1, -1)
 
 
+# Enum iteration and .value access are slow in per-tick movement code, so the
+# direction tables are built once at import.
+DIRECTION_OFFSETS: Dict[Direction, Tuple[int, int]] = {
+    direction: direction.value for direction in Direction
+}
+_OFFSET_TO_DIRECTION: Dict[Tuple[int, int], Direction] = {
+    direction.value: direction for direction in Direction
+}
+
+
+@lru_cache(maxsize=None)
+def _adjacent_positions(x: int, y: int, width: int, height: int) -> Tuple[Tuple[int, int], ...]:
+    """In-bounds neighbours of a cell; fixed for a given arena size, so computed once per cell."""
+    return tuple((x + dx, y + dy) for dx, dy in DIRECTION_OFFSETS.values()
+                 if 0 <= x + dx < width and 0 <= y + dy < height)
+
+
+# Cells a caller wants skipped; any set-like view (e.g. dict keys) is accepted
+_PositionSet = AbstractSet[Tuple[int, int]]
+
+
+class NoEmptyPositionError(Exception):
+    """Raised when the arena has no free cell left to place something on."""
+
+
 class Arena:
     """Game arena with grid-based positioning and obstacles."""
     
-    def __init__(self, width: int = 20, height: int = 20):
+    __slots__ = ('width', 'height', 'grid', 'mines', 'robots', '_free_cells', 'terrain_version',
+                 'rng')
+    
+    def __init__(self, width: int = 20, height: int = 20, rng: Optional[random.Random] = None):
         self.width = width
         self.height = height
         self.grid = [[CellType.EMPTY for _ in range(width)] for _ in range(height)]
         self.mines = {}  # Position -> (owner_id, damage)
         self.robots = {}  # Position -> Robot
+        self._free_cells: Set[Tuple[int, int]] = {
+            (x, y) for y in range(height) for x in range(width)
+        }
+        self.terrain_version = 0  # Bumped whenever passability changes
+        self.rng = rng or random  # The random module shares the global generator
         
     def is_valid_position(self, x: int, y: int) -> bool:
         """Check if position is within arena bounds."""
@@ -39,20 +73,22 @@ class Arena:
     
     def is_passable(self, x: int, y: int) -> bool:
         """Check if position can be moved to."""
-        if not self.is_valid_position(x, y):
-            return False
-        cell_type = self.grid[y][x]
-        return cell_type not in [CellType.OBSTACLE, CellType.DEAD_ROBOT]
+        # Out-of-bounds positions are never in the free-cell set, so one lookup covers both checks
+        return (x, y) in self._free_cells
     
     def place_obstacle(self, x: int, y: int):
         """Place an obstacle at position."""
         if self.is_valid_position(x, y):
             self.grid[y][x] = CellType.OBSTACLE
+            self._free_cells.discard((x, y))
+            self.terrain_version += 1
     
     def place_dead_robot(self, x: int, y: int):
         """Place a dead robot (skull) at position - becomes an obstacle."""
         if self.is_valid_position(x, y):
             self.grid[y][x] = CellType.DEAD_ROBOT
+            self._free_cells.discard((x, y))
+            self.terrain_version += 1
     
     def place_mine(self, x: int, y: int, owner_id: int, damage: int = 200):
         """Place a mine at position."""
@@ -64,120 +100,59 @@ class Arena:
         """Check if there's a mine at position."""
         return (x, y) in self.mines
     
+    def get_mine(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Get mine at position without triggering it. Returns (mine_id, damage) or None."""
+        return self.mines.get((x, y))
+    
     def trigger_mine(self, x: int, y: int) -> Optional[Tuple[int, int]]:
         """Trigger mine at position. Returns (mine_id, damage) or None."""
-        pos = (x, y)
-        if pos in self.mines:
-            mine_data = self.mines[pos]
-            del self.mines[pos]
-            return mine_data
-        return None
+        return self.mines.pop((x, y), None)
     
     def get_direction_offset(self, direction: Direction) -> Tuple[int, int]:
         """Get x,y offset for a direction."""
-        return direction.value
+        return DIRECTION_OFFSETS[direction]
     
     def get_adjacent_positions(self, x: int, y: int) -> List[Tuple[int, int]]:
         """Get all valid adjacent positions (8-directional)."""
-        adjacent = []
-        for direction in Direction:
-            dx, dy = direction.value
-            new_x, new_y = x + dx, y + dy
-            if self.is_valid_position(new_x, new_y):
-                adjacent.append((new_x, new_y))
-        return adjacent
-    
-    def get_random_empty_position(self, exclude_positions: Set[Tuple[int, int]] = None) -> Tuple[int, int]:
+        return list(_adjacent_positions(x, y, self.width, self.height))
+    
+    def get_random_empty_position(
+            self, exclude_positions: Optional[_PositionSet] = None) -> Tuple[int, int]:
         """Get a random empty position, optionally excluding certain positions."""
-        if exclude_positions is None:
-            exclude_positions = set()
-        
-        attempts = 0
-        max_attempts = 1000
-        
-        while attempts < max_attempts:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            
-            if (x, y) not in exclude_positions and self.is_passable(x, y):
-                return (x, y)
-            
-            attempts += 1
-        
-        # Fallback: find first available position
-        for y in range(self.height):
-            for x in range(self.width):
-                if (x, y) not in exclude_positions and self.is_passable(x, y):
-                    return (x, y)
-        
-        raise Exception("No empty positions available in arena")
+        candidates = self._free_cells
+        if exclude_positions:
+            candidates = candidates.difference(exclude_positions)
+        if not candidates:
+            raise NoEmptyPositionError("No empty positions available in arena")
+        
+        # Sampling from the tracked free cells avoids rejection retries on crowded arenas
+        return self.rng.choice(tuple(candidates))
     
-    def generate_obstacles(self, count: int, exclude_positions: Set[Tuple[int, int]] = None):
+    def generate_obstacles(self, count: int, exclude_positions: Optional[_PositionSet] = None):
         """Randomly place obstacles in the arena."""
-        if exclude_positions is None:
-            exclude_positions = set()
-        
-        placed = 0
-        while placed < count:
-            try:
-                x, y = self.get_random_empty_position(exclude_positions)
-                self.place_obstacle(x, y)
-                exclude_positions.add((x, y))
-                placed += 1
-            except Exception:
-                break  # No more positions available
-    
-    def find_nearest_robot_position(self, from_x: int, from_y: int, 
-                                   exclude_positions: Set[Tuple[int, int]] = None) -> Optional[Tuple[int, int]]:
+        candidates = self._free_cells
+        if exclude_positions:
+            candidates = candidates.difference(exclude_positions)
+        for x, y in self.rng.sample(tuple(candidates), min(count, len(candidates))):
+            self.place_obstacle(x, y)
+    
+    def find_nearest_robot_position(
+            self, from_x: int, from_y: int,
+            exclude_positions: Optional[_PositionSet] = None) -> Optional[Tuple[int, int]]:
         """Find nearest robot position using Manhattan distance."""
-        if exclude_positions is None:
-            exclude_positions = set()
-        
-        nearest_pos = None
-        min_distance = float('inf')
-        
-        for pos in self.robots:
-            if pos not in exclude_positions:
-                x, y = pos
-                distance = abs(x - from_x) + abs(y - from_y)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_pos = pos
-        
-        return nearest_pos
+        candidates = self.robots
+        if exclude_positions:
+            candidates = [pos for pos in self.robots if pos not in exclude_positions]
+        return min(candidates, key=lambda pos: abs(pos[0] - from_x) + abs(pos[1] - from_y),
+                   default=None)
     
     def get_move_towards(self, from_x: int, from_y: int, to_x: int, to_y: int) -> Optional[Direction]:
         """Get best direction to move towards target."""
-        dx = to_x - from_x
-        dy = to_y - from_y
-        
-        if dx == 0 and dy == 0:
-            return None
-        
-        # Normalize to -1, 0, or 1
-        dx = max(-1, min(1, dx))
-        dy = max(-1, min(1, dy))
-        
-        # Find matching direction
-        for direction in Direction:
-            if direction.value == (dx, dy):
-                return direction
-        
-        return None
+        # (a > b) - (a < b) normalizes the delta to -1, 0 or 1; (0, 0) has no direction
+        return _OFFSET_TO_DIRECTION.get(((to_x > from_x) - (to_x < from_x),
+                                         (to_y > from_y) - (to_y < from_y)))
     
     def get_move_away(self, from_x: int, from_y: int, avoid_x: int, avoid_y: int) -> Optional[Direction]:
         """Get best direction to move away from target."""
-        # Invert the direction
-        target_direction = self.get_move_towards(from_x, from_y, avoid_x, avoid_y)
-        if target_direction is None:
-            return None
-        
-        dx, dy = target_direction.value
-        opposite_offset = (-dx, -dy)
-        
-        # Find matching direction
-        for direction in Direction:
-            if direction.value == opposite_offset:
-                return direction
-        
-        return None
\ No newline at end of file
+        return _OFFSET_TO_DIRECTION.get(((from_x > avoid_x) - (from_x < avoid_x),
+                                         (from_y > avoid_y) - (from_y < avoid_y)))
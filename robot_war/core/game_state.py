@@ -2,10 +2,12 @@
 
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
+import random
 
 from .robot import Robot, RobotStatus
-from .arena import Arena
-from .instructions import Instruction, InstructionType, InstructionSet
+from .arena import Arena, DIRECTION_OFFSETS
+from .instructions import (Instruction, InstructionType, InstructionSet, ENERGY_COST_TABLE,
+                           DAMAGE_TABLE)
 
 
 class GamePhase(Enum):
@@ -15,11 +17,33 @@ class GamePhase(Enum):
     FINISHED = "finished"
 
 
+class CombatEvent(Enum):
+    FIRE_ROW = "FR"
+    FIRE_COLUMN = "FC"
+    HIT = "hit"
+
+
+# (event, robot name, x, y, damage, destroyed) - formatted only when displayed
+CombatLogEntry = Tuple[CombatEvent, str, int, int, int, bool]
+
+
+# Statuses skipped by enemy queries; tuples are the fastest membership test here
+_UNTARGETABLE_STATUSES = (RobotStatus.DEAD, RobotStatus.INVISIBLE)
+_UNDETECTABLE_STATUSES = (RobotStatus.DEAD, RobotStatus.INVISIBLE, RobotStatus.FROZEN)
+
+
 class GameState:
     """Manages overall game state, turns, and win conditions."""
 
-    def __init__(self, arena_width: int = 20, arena_height: int = 20):
-        self.arena = Arena(arena_width, arena_height)
+    __slots__ = ('arena', 'robots', 'phase', 'current_turn', 'max_turns', 'winner_id',
+                 'num_players', 'program_length', 'starting_energy', 'num_obstacles',
+                 'proximity_distance', 'combat_log', '_los_cache', '_los_cache_version', 'rng')
+
+    def __init__(self, arena_width: int = 20, arena_height: int = 20, num_obstacles: int = 20,
+                 rng: Optional[random.Random] = None):
+        # Pass a seeded random.Random for a reproducible game without touching global state
+        self.rng = rng or random
+        self.arena = Arena(arena_width, arena_height, rng)
         self.robots: List[Robot] = []
         self.phase = GamePhase.SETUP
         self.current_turn = 0
@@ -30,20 +54,23 @@ class GameState:
         self.num_players = 1
         self.program_length = 20
         self.starting_energy = 1500
-        self.num_obstacles = 20
+        self.num_obstacles = num_obstacles  # Placed by setup_arena, not here
         self.proximity_distance = 5  # Distance for PT (Proximity Test) instruction
         
         # Combat log for this turn
-        self.combat_log: List[str] = []
+        self.combat_log: List[CombatLogEntry] = []
+
+        # Line-of-sight results, valid while arena.terrain_version is unchanged
+        self._los_cache: Dict[Tuple[int, int, int, int], bool] = {}
+        self._los_cache_version = -1
 
     def add_robot(self, player_id: int, energy: Optional[int] = None, name: Optional[str] = None) -> Robot:
         """Add a robot to the game."""
         if energy is None:
             energy = self.starting_energy
 
-        # Find empty position for robot
-        used_positions = {robot.get_position() for robot in self.robots}
-        x, y = self.arena.get_random_empty_position(used_positions)
+        # Find empty position for robot; arena.robots is the live occupancy index
+        x, y = self.arena.get_random_empty_position(self.arena.robots.keys())
 
         robot = Robot(player_id, x, y, energy, name)
         self.robots.append(robot)
@@ -53,13 +80,12 @@ class GameState:
 
     def get_living_robots(self) -> List[Robot]:
         """Get all robots that are still alive."""
-        return [robot for robot in self.robots if robot.is_alive()]
+        return [robot for robot in self.robots if robot.status != RobotStatus.DEAD]
 
     def setup_arena(self):
         """Generate obstacles in the arena."""
-        # Get all robot positions to exclude from obstacle placement
-        robot_positions = {robot.get_position() for robot in self.robots}
-        self.arena.generate_obstacles(self.num_obstacles, robot_positions)
+        # Exclude occupied robot positions from obstacle placement
+        self.arena.generate_obstacles(self.num_obstacles, self.arena.robots.keys())
 
     def start_programming(self):
         """Transition to programming phase."""
@@ -86,12 +112,18 @@ class GameState:
             self._determine_winner()
             return False
 
+        # Frozen robots never recover, so once none can act the outcome is settled
+        if not any(robot.can_execute() for robot in living_robots):
+            self._determine_winner()
+            return False
+
         # Clear combat log for this turn
         self.combat_log.clear()
 
-        # Update robot states from previous turn first
+        # Update robot states from previous turn first; only invisible robots have a countdown
         for robot in living_robots:
-            robot.update_invisibility()
+            if robot.status == RobotStatus.INVISIBLE:
+                robot.update_invisibility()
 
         # Execute all robot instructions simultaneously
         self._execute_robot_instructions(living_robots)
@@ -110,37 +142,35 @@ class GameState:
         # Will need to handle movement conflicts, attacks, etc.
 
         for robot in robots:
-            if not robot.is_alive():
-                continue
-
-            # Skip frozen robots (energy preservation mode)
-            if not robot.can_execute():
+            # Skip dead and frozen robots (energy preservation mode) with one status read
+            status = robot.status
+            if status == RobotStatus.DEAD or status == RobotStatus.FROZEN:
                 continue
 
-            instruction_str = robot.get_current_instruction()
-            if not instruction_str:
+            program = robot.program
+            if not program:
                 continue
+            instruction_str = program[robot.program_counter]
 
             instruction = InstructionSet.parse_instruction(instruction_str)
             if not instruction:
                 continue
 
             # Check energy cost - use emergency routine if can't afford instruction
-            energy_cost = InstructionSet.get_energy_cost(instruction.type)
-            if robot.energy < energy_cost or robot.energy <= robot.emergency_energy_threshold:
+            energy_cost = ENERGY_COST_TABLE[instruction.type]
+            energy = robot.energy
+            if energy < energy_cost or energy <= robot.emergency_energy_threshold:
                 if robot.emergency_action:
                     self._execute_emergency_routine(robot)
                 else:
                     robot.status = RobotStatus.FROZEN  # No emergency action - freeze
                 continue
 
-            was_alive = robot.is_alive()
-            
             if not robot.use_energy(energy_cost):
                 continue  # Should not happen due to check above
 
-            # Check if robot died from energy loss
-            if was_alive and not robot.is_alive():
+            # Check if robot died from energy loss (it was alive when selected above)
+            if robot.status == RobotStatus.DEAD:
                 self._handle_robot_death(robot)
                 continue
 
@@ -148,101 +178,107 @@ class GameState:
 
     def _execute_single_instruction(self, robot: Robot, instruction: Instruction):
         """Execute a single instruction for a robot."""
-        # This is a placeholder - needs full implementation
-        instruction_type = instruction.type
-
-        if instruction_type == InstructionType.DM:
-            # Directed movement
-            self._move_robot(robot, instruction.direction)
-        elif instruction_type == InstructionType.RM:
-            # Random movement
-            direction = InstructionSet.get_random_direction()
-            self._move_robot(robot, direction)
-        elif instruction_type == InstructionType.IN:
-            # Invisibility
-            robot.set_invisible(1)
-        elif instruction_type == InstructionType.MI:
-            # Place mine
-            self._place_mine(robot)
-        elif instruction_type == InstructionType.PM:
-            # Pursue nearest enemy
-            target_direction = self._get_direction_to_nearest_enemy(robot)
-            if target_direction:
-                self._move_robot(robot, target_direction)
-        elif instruction_type == InstructionType.AM:
-            # Avoid nearest enemy (flee)
-            flee_direction = self._get_direction_from_nearest_enemy(robot)
-            if flee_direction:
-                self._move_robot(robot, flee_direction)
-        elif instruction_type == InstructionType.PT:
-            # Proximity test with conditional execution: PT(action_if_true, action_if_false)
-            self._execute_proximity_test_conditional(robot, instruction)
-        elif instruction_type == InstructionType.FR:
-            # Fire row - shoot left and right
-            self._fire_row(robot)
-        elif instruction_type == InstructionType.FC:
-            # Fire column - shoot up and down
-            self._fire_column(robot)
+        self._INSTRUCTION_HANDLERS[instruction.type](self, robot, instruction)
+
+    def _handle_directed_move(self, robot: Robot, instruction: Instruction):
+        """DM: move in the instruction's direction."""
+        self._move_robot(robot, instruction.direction)
+
+    def _handle_random_move(self, robot: Robot, instruction: Instruction):
+        """RM: move in a random direction."""
+        self._move_robot(robot, InstructionSet.get_random_direction(self.rng))
+
+    def _handle_pursue_move(self, robot: Robot, instruction: Instruction):
+        """PM: move toward the nearest visible enemy, if any."""
+        self._move_robot(robot, self._get_direction_to_nearest_enemy(robot))
+
+    def _handle_avoid_move(self, robot: Robot, instruction: Instruction):
+        """AM: move away from the nearest visible enemy, if any."""
+        self._move_robot(robot, self._get_direction_from_nearest_enemy(robot))
+
+    def _handle_mine(self, robot: Robot, instruction: Instruction):
+        """MI: place a mine on the robot's cell."""
+        self._place_mine(robot)
+
+    def _handle_invisibility(self, robot: Robot, instruction: Instruction):
+        """IN: become invisible for one turn."""
+        robot.set_invisible(1)
+
+    def _handle_fire_row(self, robot: Robot, instruction: Instruction):
+        """FR: fire left and right along the robot's row."""
+        self._fire_row(robot)
+
+    def _handle_fire_column(self, robot: Robot, instruction: Instruction):
+        """FC: fire up and down along the robot's column."""
+        self._fire_column(robot)
+
+    def _handle_proximity_test(self, robot: Robot, instruction: Instruction):
+        """PT: run one of the instruction's two actions depending on enemy proximity."""
+        self._execute_proximity_test_conditional(robot, instruction)
+
+    # Looked up per instruction instead of walking an if/elif chain
+    _INSTRUCTION_HANDLERS = {
+        InstructionType.DM: _handle_directed_move,
+        InstructionType.RM: _handle_random_move,
+        InstructionType.PM: _handle_pursue_move,
+        InstructionType.AM: _handle_avoid_move,
+        InstructionType.MI: _handle_mine,
+        InstructionType.IN: _handle_invisibility,
+        InstructionType.FR: _handle_fire_row,
+        InstructionType.FC: _handle_fire_column,
+        InstructionType.PT: _handle_proximity_test,
+    }
 
     def _move_robot(self, robot: Robot, direction):
         """Move robot in specified direction if possible."""
         if direction is None:
             return
 
-        current_x, current_y = robot.get_position()
-        dx, dy = self.arena.get_direction_offset(direction)
+        arena = self.arena
+        robots = arena.robots
+        current_x, current_y = robot.x, robot.y
+        dx, dy = DIRECTION_OFFSETS[direction]
         new_x, new_y = current_x + dx, current_y + dy
 
         # Check if move is valid
-        if not self.arena.is_passable(new_x, new_y):
+        if not arena.is_passable(new_x, new_y):
             return
 
         # Check for robot collision
-        if (new_x, new_y) in self.arena.robots:
+        if (new_x, new_y) in robots:
             return  # Position occupied
 
         # Check for mines before moving - own mines block movement
-        if self.arena.has_mine(new_x, new_y):
-            mine_data = self.arena.trigger_mine(new_x, new_y)
-            if mine_data:
-                mine_id, damage = mine_data
-                mine_owner = mine_id // 10  # Decode ownership from mine ID
-                
-                if mine_owner == robot.player_id:
-                    # Own mine - put it back and block movement
-                    self.arena.place_mine(new_x, new_y, robot.player_id, damage)
-                    return  # Can't step on own mines
-                else:
-                    # Enemy mine - explode after moving
-                    # Update robot position first
-                    del self.arena.robots[(current_x, current_y)]
-                    robot.set_position(new_x, new_y)
-                    self.arena.robots[(new_x, new_y)] = robot
-                    
-                    # Apply mine damage
-                    was_alive = robot.is_alive()
-                    robot.take_damage(damage)
-                    
-                    # Check if robot died from mine damage
-                    if was_alive and not robot.is_alive():
-                        self._handle_robot_death(robot)
-                    return
-
-        # No mine - normal movement
-        del self.arena.robots[(current_x, current_y)]
-        robot.set_position(new_x, new_y)
-        self.arena.robots[(new_x, new_y)] = robot
+        mine_data = arena.get_mine(new_x, new_y)
+        if mine_data and mine_data[0] // 10 == robot.player_id:  # Decode ownership from mine ID
+            return  # Can't step on own mines
+
+        del robots[(current_x, current_y)]
+        robot.x, robot.y = new_x, new_y
+        robots[(new_x, new_y)] = robot
+
+        if mine_data:
+            # Enemy mine - explode after moving
+            _, damage = arena.trigger_mine(new_x, new_y)
+            
+            # Apply mine damage
+            was_alive = robot.status != RobotStatus.DEAD
+            robot.take_damage(damage)
+            
+            # Check if robot died from mine damage
+            if was_alive and robot.status == RobotStatus.DEAD:
+                self._handle_robot_death(robot)
 
     def _place_mine(self, robot: Robot):
         """Place a mine at robot's current position."""
-        x, y = robot.get_position()
+        x, y = robot.x, robot.y
 
         # Don't place mine if there's already one there
         if self.arena.has_mine(x, y):
             return
 
         # Place mine with standard damage
-        damage = InstructionSet.get_damage(InstructionType.MI)
+        damage = DAMAGE_TABLE[InstructionType.MI]
         self.arena.place_mine(x, y, robot.player_id, damage)
 
     def _determine_winner(self):
@@ -281,25 +317,39 @@ class GameState:
             'winner': self.winner_id
         }
 
+    def get_combat_log_lines(self) -> List[str]:
+        """Format this turn's combat log entries for display."""
+        lines = []
+        for event, name, x, y, damage, destroyed in self.combat_log:
+            if event is CombatEvent.HIT:
+                status = "destroyed" if destroyed else f"damaged for {damage}"
+                lines.append(f"  → hits {name} at ({x},{y}) - {status}")
+            else:
+                lines.append(f"{name} fires {event.value} from ({x},{y})")
+        return lines
+
     def _find_nearest_enemy(self, robot: Robot) -> Optional[Robot]:
         """Find the nearest enemy robot to the given robot."""
-        robot_x, robot_y = robot.get_position()
+        robot_x, robot_y, player_id = robot.x, robot.y, robot.player_id
         nearest_enemy = None
         min_distance = float('inf')
 
-        for other_robot in self.get_living_robots():
-            # Skip self and invisible robots (undetectable for targeting)
-            if other_robot.player_id == robot.player_id:
+        # Scan self.robots directly rather than building a living-robots list per query
+        for other_robot in self.robots:
+            # Skip self, dead robots and invisible robots (undetectable for targeting)
+            if other_robot.player_id == player_id:
                 continue
-            if other_robot.status == RobotStatus.INVISIBLE:
+            if other_robot.status in _UNTARGETABLE_STATUSES:
                 continue  # Invisible robots can't be targeted by PM/AM
 
-            other_x, other_y = other_robot.get_position()
-            distance = abs(robot_x - other_x) + abs(robot_y - other_y)  # Manhattan distance
+            # Manhattan distance
+            distance = abs(robot_x - other_robot.x) + abs(robot_y - other_robot.y)
             
             if distance < min_distance:
                 min_distance = distance
                 nearest_enemy = other_robot
+                if distance == 1:
+                    break  # Robots occupy distinct cells, so an adjacent enemy can't be beaten
 
         return nearest_enemy
 
@@ -309,8 +359,8 @@ class GameState:
         if not nearest_enemy:
             return None
 
-        robot_x, robot_y = robot.get_position()
-        enemy_x, enemy_y = nearest_enemy.get_position()
+        robot_x, robot_y = robot.x, robot.y
+        enemy_x, enemy_y = nearest_enemy.x, nearest_enemy.y
 
         return self.arena.get_move_towards(robot_x, robot_y, enemy_x, enemy_y)
 
@@ -320,14 +370,14 @@ class GameState:
         if not nearest_enemy:
             return None
 
-        robot_x, robot_y = robot.get_position()
-        enemy_x, enemy_y = nearest_enemy.get_position()
+        robot_x, robot_y = robot.x, robot.y
+        enemy_x, enemy_y = nearest_enemy.x, nearest_enemy.y
 
         return self.arena.get_move_away(robot_x, robot_y, enemy_x, enemy_y)
 
     def _handle_robot_death(self, robot: Robot):
         """Handle robot death - place skull obstacle and remove from robots dict."""
-        x, y = robot.get_position()
+        x, y = robot.x, robot.y
         
         # Remove robot from arena robots dict
         if (x, y) in self.arena.robots:
@@ -353,7 +403,7 @@ class GameState:
         chosen_instruction = InstructionSet.parse_instruction(chosen_action_str)
         if chosen_instruction:
             # Calculate energy cost for the chosen action (PT cost already deducted)
-            action_cost = InstructionSet.get_energy_cost(chosen_instruction.type)
+            action_cost = ENERGY_COST_TABLE[chosen_instruction.type]
             
             # Use energy for PT + action (already used PT energy in main execution)
             if robot.use_energy(action_cost):
@@ -361,18 +411,19 @@ class GameState:
 
     def _check_proximity(self, robot: Robot) -> bool:
         """Check for enemy robots within configured distance with line-of-sight."""
-        robot_x, robot_y = robot.get_position()
+        robot_x, robot_y, player_id = robot.x, robot.y, robot.player_id
+        proximity_distance = self.proximity_distance
         
         # Check for enemies within proximity distance (invisible/frozen robots return FALSE)
-        for other_robot in self.get_living_robots():
-            if other_robot.player_id == robot.player_id:
+        for other_robot in self.robots:
+            if other_robot.player_id == player_id:
                 continue  # Skip self
-            if other_robot.status in [RobotStatus.INVISIBLE, RobotStatus.FROZEN]:
-                continue  # Invisible and frozen robots are not detected by PT
+            if other_robot.status in _UNDETECTABLE_STATUSES:
+                continue  # Dead, invisible and frozen robots are not detected by PT
             
-            other_x, other_y = other_robot.get_position()
+            other_x, other_y = other_robot.x, other_robot.y
             distance = abs(robot_x - other_x) + abs(robot_y - other_y)
-            if distance <= self.proximity_distance:
+            if distance <= proximity_distance:
                 # Check line-of-sight - obstacles block detection
                 if self._has_line_of_sight(robot_x, robot_y, other_x, other_y):
                     return True
@@ -381,39 +432,56 @@ class GameState:
 
     def _has_line_of_sight(self, from_x: int, from_y: int, to_x: int, to_y: int) -> bool:
         """Check if there's a clear line of sight between two positions."""
+        terrain_version = self.arena.terrain_version
+        if self._los_cache_version != terrain_version:
+            self._los_cache.clear()
+            self._los_cache_version = terrain_version
+        
+        # Bresenham ties resolve differently from each endpoint, so always trace from the
+        # lower one: sight stays symmetric and both directions share one cache entry
+        if (from_x, from_y) > (to_x, to_y):
+            from_x, from_y, to_x, to_y = to_x, to_y, from_x, from_y
+        key = (from_x, from_y, to_x, to_y)
+        result = self._los_cache.get(key)
+        if result is None:
+            result = self._los_cache[key] = self._trace_line_of_sight(from_x, from_y, to_x, to_y)
+        return result
+
+    def _trace_line_of_sight(self, from_x: int, from_y: int, to_x: int, to_y: int) -> bool:
+        """Walk the line between two positions and report whether it is unobstructed."""
         # Special case: same position
         if from_x == to_x and from_y == to_y:
             return True
         
-        # Use simple line traversal - check each step along the path
-        dx = to_x - from_x
-        dy = to_y - from_y
-        
-        # Get the number of steps (max of dx, dy)
-        steps = max(abs(dx), abs(dy))
+        is_valid_position = self.arena.is_valid_position
+        if not (is_valid_position(from_x, from_y) and is_valid_position(to_x, to_y)):
+            return False
         
-        # Calculate step increments
-        x_step = dx / steps if steps > 0 else 0
-        y_step = dy / steps if steps > 0 else 0
+        # Integer Bresenham traversal from start towards target
+        dx = abs(to_x - from_x)
+        dy = abs(to_y - from_y)
+        sx = 1 if to_x > from_x else -1
+        sy = 1 if to_y > from_y else -1
+        err = dx - dy
+        is_passable = self.arena.is_passable
+        x, y = from_x, from_y
         
-        # Check each position along the line (excluding start, including end)
-        for i in range(1, steps + 1):
-            x = from_x + round(x_step * i)
-            y = from_y + round(y_step * i)
-            
-            # Check if position is valid and passable
-            if not self.arena.is_valid_position(x, y):
-                return False
+        while True:
+            err2 = 2 * err
+            if err2 > -dy:
+                err -= dy
+                x += sx
+            if err2 < dx:
+                err += dx
+                y += sy
             
             # For the target position, we don't check passability (robot can be there)
             if x == to_x and y == to_y:
                 return True
-                
-            # For intermediate positions, check if passable
-            if not self.arena.is_passable(x, y):
+            
+            # Intermediate cells lie inside the bounding box, so passability covers bounds
+            if not is_passable(x, y):
                 return False
-        
-        return True
 
     def _execute_emergency_routine(self, robot: Robot):
         """Execute robot's emergency action (Circuit de Secours)."""
@@ -425,15 +493,15 @@ class GameState:
             return
         
         # Check if robot can afford emergency action
-        emergency_cost = InstructionSet.get_energy_cost(emergency_instruction.type)
+        emergency_cost = ENERGY_COST_TABLE[emergency_instruction.type]
         if robot.energy >= emergency_cost:
-            was_alive = robot.is_alive()
+            was_alive = robot.status != RobotStatus.DEAD
             
             if robot.use_energy(emergency_cost):
                 self._execute_single_instruction(robot, emergency_instruction)
                 
                 # Check if robot died from emergency action
-                if was_alive and not robot.is_alive():
+                if was_alive and robot.status == RobotStatus.DEAD:
                     self._handle_robot_death(robot)
         else:
             # Can't even afford emergency action - freeze
@@ -441,111 +509,45 @@ class GameState:
 
     def _fire_row(self, robot: Robot):
         """Fire horizontally in both directions from robot position."""
-        robot_x, robot_y = robot.get_position()
-        max_range = self.proximity_distance  # Limited by proximity detector range
-        damage = InstructionSet.get_damage(InstructionType.FR)
-        
-        self.combat_log.append(f"{robot.name} fires FR from ({robot_x},{robot_y})")
-        
-        # Fire left (decreasing X)
-        for distance in range(1, max_range + 1):
-            target_x = robot_x - distance
-            if not self.arena.is_valid_position(target_x, robot_y):
-                break  # Out of bounds
-            
-            # Check for obstacle - blocks shot
-            if not self.arena.is_passable(target_x, robot_y):
-                break  # Shot blocked by obstacle
-            
-            # Check for robot target
-            target_robot = self.arena.robots.get((target_x, robot_y))
-            if target_robot and target_robot.player_id != robot.player_id:
-                # Hit enemy robot (invisible robots can still be hit by area fire)
-                was_alive = target_robot.is_alive()
-                target_robot.take_damage(damage)
-                
-                # Log the hit
-                status = "destroyed" if not target_robot.is_alive() else f"damaged for {damage}"
-                self.combat_log.append(f"  → hits {target_robot.name} at ({target_x},{robot_y}) - {status}")
-                
-                if was_alive and not target_robot.is_alive():
-                    self._handle_robot_death(target_robot)
-                break  # Shot stops after hitting target
-        
-        # Fire right (increasing X)
-        for distance in range(1, max_range + 1):
-            target_x = robot_x + distance
-            if not self.arena.is_valid_position(target_x, robot_y):
-                break  # Out of bounds
-            
-            # Check for obstacle - blocks shot
-            if not self.arena.is_passable(target_x, robot_y):
-                break  # Shot blocked by obstacle
-            
-            # Check for robot target
-            target_robot = self.arena.robots.get((target_x, robot_y))
-            if target_robot and target_robot.player_id != robot.player_id:
-                # Hit enemy robot
-                was_alive = target_robot.is_alive()
-                target_robot.take_damage(damage)
-                
-                # Log the hit
-                status = "destroyed" if not target_robot.is_alive() else f"damaged for {damage}"
-                self.combat_log.append(f"  → hits Robot {target_robot.player_id} at ({target_x},{robot_y}) - {status}")
-                
-                if was_alive and not target_robot.is_alive():
-                    self._handle_robot_death(target_robot)
-                break  # Shot stops after hitting target
+        damage = DAMAGE_TABLE[InstructionType.FR]
+        self.combat_log.append((CombatEvent.FIRE_ROW, robot.name, robot.x, robot.y, 0, False))
+        self._fire_ray(robot, -1, 0, damage)  # Fire left (decreasing X)
+        self._fire_ray(robot, 1, 0, damage)   # Fire right (increasing X)
 
     def _fire_column(self, robot: Robot):
         """Fire vertically in both directions from robot position."""
-        robot_x, robot_y = robot.get_position()
-        max_range = self.proximity_distance  # Limited by proximity detector range
-        damage = InstructionSet.get_damage(InstructionType.FC)
-        
-        self.combat_log.append(f"{robot.name} fires FC from ({robot_x},{robot_y})")
+        damage = DAMAGE_TABLE[InstructionType.FC]
+        self.combat_log.append((CombatEvent.FIRE_COLUMN, robot.name, robot.x, robot.y, 0, False))
+        self._fire_ray(robot, 0, -1, damage)  # Fire up (decreasing Y)
+        self._fire_ray(robot, 0, 1, damage)   # Fire down (increasing Y)
+
+    def _fire_ray(self, robot: Robot, dx: int, dy: int, damage: int):
+        """Fire a shot from robot along (dx, dy) that stops at the first obstacle or enemy hit."""
+        target_x, target_y = robot.x, robot.y
+        player_id = robot.player_id
+        # Bind per-step lookups once; the loop body runs up to proximity_distance times
+        is_passable = self.arena.is_passable
+        robot_at = self.arena.robots.get
         
-        # Fire up (decreasing Y)
-        for distance in range(1, max_range + 1):
-            target_y = robot_y - distance
-            if not self.arena.is_valid_position(robot_x, target_y):
-                break  # Out of bounds
-            
-            # Check for obstacle - blocks shot
-            if not self.arena.is_passable(robot_x, target_y):
-                break  # Shot blocked by obstacle
+        for _ in range(self.proximity_distance):  # Limited by proximity detector range
+            target_x += dx
+            target_y += dy
+            # Obstacles block the shot; off-arena cells are never passable either
+            if not is_passable(target_x, target_y):
+                break  # Shot blocked by obstacle or out of bounds
             
             # Check for robot target
-            target_robot = self.arena.robots.get((robot_x, target_y))
-            if target_robot and target_robot.player_id != robot.player_id:
-                # Hit enemy robot
-                was_alive = target_robot.is_alive()
+            target_robot = robot_at((target_x, target_y))
+            if target_robot and target_robot.player_id != player_id:
+                # Hit enemy robot (invisible robots can still be hit by area fire)
+                was_alive = target_robot.status != RobotStatus.DEAD
                 target_robot.take_damage(damage)
+                destroyed = target_robot.status == RobotStatus.DEAD
                 
                 # Log the hit
-                status = "destroyed" if not target_robot.is_alive() else f"damaged for {damage}"
-                self.combat_log.append(f"  → hits {target_robot.name} at ({robot_x},{target_y}) - {status}")
+                self.combat_log.append((CombatEvent.HIT, target_robot.name, target_x, target_y,
+                                        damage, destroyed))
                 
-                if was_alive and not target_robot.is_alive():
-                    self._handle_robot_death(target_robot)
-                break  # Shot stops after hitting target
-        
-        # Fire down (increasing Y)
-        for distance in range(1, max_range + 1):
-            target_y = robot_y + distance
-            if not self.arena.is_valid_position(robot_x, target_y):
-                break  # Out of bounds
-            
-            # Check for obstacle - blocks shot
-            if not self.arena.is_passable(robot_x, target_y):
-                break  # Shot blocked by obstacle
-            
-            # Check for robot target
-            target_robot = self.arena.robots.get((robot_x, target_y))
-            if target_robot and target_robot.player_id != robot.player_id:
-                # Hit enemy robot
-                was_alive = target_robot.is_alive()
-                target_robot.take_damage(damage)
-                if was_alive and not target_robot.is_alive():
+                if was_alive and destroyed:
                     self._handle_robot_death(target_robot)
                 break  # Shot stops after hitting target
@@ -1,33 +1,35 @@
 """Instruction set definitions and execution logic."""
 
-from enum import Enum
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 import random
+import re
 
 from .arena import Direction
 
 
-class InstructionType(Enum):
-    DM = "directed_move"     # Move in player-chosen direction. e.g. DM(NW)
-    RM = "random_move"       # Move in random direction
-    PM = "pursue_enemy"      # Move toward nearest enemy
-    AM = "avoid_enemy"       # Move away from nearest enemy
-    MI = "lay_mine"          # Place mine on current tile
-    IN = "invisibility"      # Become invisible for 1 turn
-    FR = "fire_row"          # Fire horizontally
-    FC = "fire_column"       # Fire vertically
-    PT = "proximity_test"    # Test if mine or enemy is adjacent
+class InstructionType(IntEnum):
+    # Integer-valued so hot-path dict lookups and comparisons use int hashing
+    DM = 0  # Move in player-chosen direction. e.g. DM(NW)
+    RM = 1  # Move in random direction
+    PM = 2  # Move toward nearest enemy
+    AM = 3  # Move away from nearest enemy
+    MI = 4  # Place mine on current tile
+    IN = 5  # Become invisible for 1 turn
+    FR = 6  # Fire horizontally
+    FC = 7  # Fire vertically
+    PT = 8  # Test if mine or enemy is adjacent
 
 
+@dataclass(frozen=True)
 class Instruction:
-    """Represents a single robot instruction."""
+    """Represents a single robot instruction; immutable because parsed instances are shared."""
 
-    def __init__(self, instruction_type: InstructionType,
-                 direction: Optional[Direction] = None,
-                 parameter: Any = None):
-        self.type = instruction_type
-        self.direction = direction  # For DM (directed move)
-        self.parameter = parameter  # For future extensions
+    type: InstructionType
+    direction: Optional[Direction] = None  # For DM (directed move)
+    parameter: Any = None  # For future extensions
 
     def __str__(self):
         if self.direction:
@@ -59,12 +61,12 @@ class InstructionSet:
     @classmethod
     def get_energy_cost(cls, instruction_type: InstructionType) -> int:
         """Get energy cost for an instruction."""
-        return cls.ENERGY_COSTS.get(instruction_type, 0)
+        return ENERGY_COST_TABLE[instruction_type]
 
     @classmethod
     def get_damage(cls, instruction_type: InstructionType) -> int:
         """Get damage value for an instruction."""
-        return cls.DAMAGE_VALUES.get(instruction_type, 0)
+        return DAMAGE_TABLE[instruction_type]
 
     @classmethod
     def get_all_directions(cls) -> list:
@@ -72,65 +74,14 @@ class InstructionSet:
         return list(Direction)
 
     @classmethod
-    def get_random_direction(cls) -> Direction:
-        """Get a random direction."""
-        return random.choice(list(Direction))
+    def get_random_direction(cls, rng: Optional[random.Random] = None) -> Direction:
+        """Get a random direction, drawn from rng when given."""
+        return (rng or random).choice(list(Direction))
 
     @classmethod
     def parse_instruction(cls, instruction_str: str) -> Optional[Instruction]:
         """Parse instruction string into Instruction object."""
-        parts = instruction_str.split('(')
-        instruction_name = parts[0].strip().upper()
-
-        try:
-            instruction_type = InstructionType[instruction_name]
-        except KeyError:
-            return None
-
-        direction = None
-        parameter = None
-        
-        if len(parts) > 1:
-            if instruction_type == InstructionType.DM:
-                # Extract direction for DM instruction
-                direction_str = parts[1].rstrip(')').strip().upper()
-                try:
-                    direction = Direction[direction_str]
-                except KeyError:
-                    return None
-            elif instruction_type == InstructionType.PT:
-                # Extract conditional actions for PT instruction: PT(action1,action2)
-                # Handle nested parentheses properly
-                full_content = instruction_str[instruction_str.find('(')+1:instruction_str.rfind(')')]
-                actions = []
-                paren_depth = 0
-                current_action = ""
-                
-                for char in full_content:
-                    if char == '(':
-                        paren_depth += 1
-                        current_action += char
-                    elif char == ')':
-                        paren_depth -= 1
-                        current_action += char
-                    elif char == ',' and paren_depth == 0:
-                        actions.append(current_action.strip())
-                        current_action = ""
-                    else:
-                        current_action += char
-                
-                if current_action.strip():
-                    actions.append(current_action.strip())
-                
-                # Check that we have exactly 2 non-empty actions
-                if len(actions) != 2 or any(not action for action in actions):
-                    return None  # PT requires exactly 2 non-empty actions
-                parameter = tuple(actions)  # Store as (action_if_true, action_if_false)
-        elif instruction_type == InstructionType.PT:
-            # PT requires parentheses with actions
-            return None
-
-        return Instruction(instruction_type, direction, parameter)
+        return _parse_instruction(instruction_str)
 
     @classmethod
     def instruction_to_string(cls, instruction: Instruction) -> str:
@@ -156,6 +107,14 @@ class InstructionSet:
         return descriptions.get(instruction_type, "Unknown instruction")
 
 
+# Tuple views of the cost tables indexed directly by InstructionType's int value
+ENERGY_COST_TABLE = tuple(InstructionSet.ENERGY_COSTS.get(instruction_type, 0)
+                          for instruction_type in InstructionType)
+DAMAGE_TABLE = tuple(InstructionSet.DAMAGE_VALUES.get(instruction_type, 0)
+                     for instruction_type in InstructionType)
+MAX_ENERGY_COST = max(InstructionSet.ENERGY_COSTS.values())
+
+
 def create_program_from_strings(instruction_strings: list) -> list:
     """Create a program from list of instruction strings."""
     program = []
@@ -164,3 +123,49 @@ def create_program_from_strings(instruction_strings: list) -> list:
         if instruction:
             program.append(instruction)
     return program
+
+
+# Mnemonic plus optional parenthesised arguments, e.g. "RM", "DM(NW)", "PT(DM(N),FR)"
+_INSTRUCTION_RE = re.compile(r'\s*([A-Za-z]+)\s*(?:\((.*)\))?\s*')
+_TYPE_BY_NAME: Dict[str, InstructionType] = {instruction_type.name: instruction_type
+                                             for instruction_type in InstructionType}
+_DIRECTION_BY_NAME: Dict[str, Direction] = {direction.name: direction for direction in Direction}
+# A comma followed by a closing paren (before any opening one) sits inside a nested action
+_PT_SPLIT = re.compile(r',(?![^()]*\))')
+
+
+def _split_top_level_commas(text: str) -> List[str]:
+    """Split text on commas that are not nested inside parentheses."""
+    return [part.strip() for part in _PT_SPLIT.split(text)]
+
+
+@lru_cache(maxsize=None)
+def _parse_instruction(instruction_str: str) -> Optional[Instruction]:
+    """Parse an instruction string once; repeated strings hit the cache."""
+    match = _INSTRUCTION_RE.fullmatch(instruction_str)
+    if not match:
+        return None
+
+    instruction_type = _TYPE_BY_NAME.get(match.group(1).upper())
+    if instruction_type is None:
+        return None
+
+    arguments = match.group(2)
+    direction = None
+    parameter = None
+
+    if instruction_type == InstructionType.PT:
+        # PT requires parentheses with actions: PT(action_if_true,action_if_false)
+        if arguments is None:
+            return None
+        actions = _split_top_level_commas(arguments)
+        if len(actions) != 2 or not all(actions):
+            return None  # PT requires exactly 2 non-empty actions
+        parameter = tuple(actions)  # Store as (action_if_true, action_if_false)
+    elif instruction_type == InstructionType.DM and arguments is not None:
+        # Extract direction for DM instruction
+        direction = _DIRECTION_BY_NAME.get(arguments.strip().upper())
+        if direction is None:
+            return None
+
+    return Instruction(instruction_type, direction, parameter)
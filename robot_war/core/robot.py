@@ -1,19 +1,29 @@
 """Robot class - handles robot state, energy, and program execution."""
 
-from typing import List, Optional, Tuple
-from enum import Enum
+from typing import Optional, Sequence, Tuple
+from enum import IntEnum
 
+from .instructions import MAX_ENERGY_COST
 
-class RobotStatus(Enum):
-    ALIVE = "alive"
-    DEAD = "dead"
-    INVISIBLE = "invisible"
-    FROZEN = "frozen"  # Energy preservation mode - can't afford next instruction
+
+class RobotStatus(IntEnum):
+    # Integer-valued so per-turn status comparisons and membership tests stay in C
+    ALIVE = 0
+    DEAD = 1
+    INVISIBLE = 2
+    FROZEN = 3  # Energy preservation mode - can't afford next instruction
 
 
 class Robot:
     """A robot that can be programmed and battles in the arena."""
     
+    __slots__ = ('player_id', 'name', 'x', 'y', 'energy', 'max_energy', 'program',
+                 'program_counter', 'status', 'invisible_turns', 'emergency_action',
+                 'emergency_energy_threshold', 'energy_threshold')
+    
+    # Slightly above the highest instruction cost so the emergency action stays affordable
+    DEFAULT_EMERGENCY_THRESHOLD = MAX_ENERGY_COST + 10
+    
     def __init__(self, player_id: int, x: int, y: int, energy: int = 1500, name: str = None):
         self.player_id = player_id
         self.name = name or f"Robot {player_id}"  # Use provided name or default
@@ -21,14 +31,13 @@ class Robot:
         self.y = y
         self.energy = energy
         self.max_energy = energy
-        self.program: List[str] = []
+        self.program: Sequence[str] = []  # Read-only during battle, so profiles may share one tuple
         self.program_counter = 0
         self.status = RobotStatus.ALIVE
         self.invisible_turns = 0
         self.emergency_action: Optional[str] = None  # Circuit de Secours
-        # Set emergency threshold slightly above highest instruction cost to ensure affordability
-        from .instructions import InstructionSet
-        self.emergency_energy_threshold = max(InstructionSet.ENERGY_COSTS.values()) + 10
+        self.energy_threshold: Optional[int] = None  # AI profile hint, assigned by the game setup
+        self.emergency_energy_threshold = self.DEFAULT_EMERGENCY_THRESHOLD
         
     def get_current_instruction(self) -> Optional[str]:
         """Get the current instruction to execute."""
@@ -50,13 +59,13 @@ class Robot:
     
     def use_energy(self, cost: int) -> bool:
         """Use energy for an action. Returns True if successful."""
-        if self.energy >= cost:
-            self.energy -= cost
-            if self.energy <= 0:
-                self.energy = 0
-                self.status = RobotStatus.DEAD
-            return True
-        return False
+        if self.energy < cost:
+            return False
+        self.energy -= cost
+        if self.energy <= 0:
+            self.energy = 0
+            self.status = RobotStatus.DEAD
+        return True
     
     def set_invisible(self, turns: int = 1):
         """Make robot invisible for specified turns."""
@@ -76,7 +85,8 @@ class Robot:
     
     def can_execute(self) -> bool:
         """Check if robot can execute instructions (not frozen or dead)."""
-        return self.status not in [RobotStatus.DEAD, RobotStatus.FROZEN]
+        status = self.status
+        return status != RobotStatus.DEAD and status != RobotStatus.FROZEN
     
     def get_position(self) -> Tuple[int, int]:
         """Get robot's current position."""
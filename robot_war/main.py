@@ -1,17 +1,25 @@
 """Main entry point for Robot War game."""
 
-import sys
 import time
-from robot_war.core.game_state import GameState, GamePhase
-from robot_war.ui.display import AnimatedDisplay
-from robot_war.ui.rich_display import RichArenaDisplay
-from robot_war.ui.setup import GameSetup
-from robot_war.ui.terminal_output import TerminalOutputManager
+from robot_war.core.game_state import GameState
+from robot_war.runner import run_battle
 from robot_war.ai.profiles import AIProfileLibrary
 
+# Pause between turns in the interactive display
+TURN_DELAY_SECONDS = 1.5
+
+# Program for AI robots whose profile name is not in the library
+_FALLBACK_AI_PROGRAM = ("RM", "PT(PM,AM)", "MI", "RM")
+_FALLBACK_EMERGENCY_ACTION = "RM"
+
 
 def main():
     """Main game loop."""
+    # UI modules pull in rich and terminal handling; import them only when the game actually runs
+    from robot_war.ui.rich_display import RichArenaDisplay
+    from robot_war.ui.setup import GameSetup
+    from robot_war.ui.terminal_output import TerminalOutputManager
+
     # Create terminal manager for centered output
     terminal = TerminalOutputManager()
     
@@ -30,14 +38,14 @@ def main():
     display = RichArenaDisplay()
     game = GameState(
         arena_width=game_config.grid_width,
-        arena_height=game_config.grid_height
+        arena_height=game_config.grid_height,
+        num_obstacles=game_config.num_obstacles
     )
     
     # Apply configuration to game
     game.max_turns = game_config.max_turns
     game.proximity_distance = game_config.proximity_distance
     game.starting_energy = game_config.starting_energy
-    game.num_obstacles = game_config.num_obstacles
     game.program_length = game_config.max_program_steps
 
     # Add robots based on configuration
@@ -48,14 +56,14 @@ def main():
             # AI robots get sophisticated programs based on their profile
             ai_profile = AIProfileLibrary.get_profile_by_name(robot_config.ai_profile)
             if ai_profile:
-                robot.program = ai_profile.program.copy()
+                robot.program = ai_profile.program
                 robot.emergency_action = ai_profile.emergency_action
                 robot.energy_threshold = ai_profile.energy_threshold
                 terminal.print_centered(f"  {robot_config.name} loaded with {ai_profile.name} strategy", "cyan")
             else:
                 # Fallback to basic random program
-                robot.program = ["RM", "PT(PM,AM)", "MI", "RM"]
-                robot.emergency_action = "RM"
+                robot.program = _FALLBACK_AI_PROGRAM
+                robot.emergency_action = _FALLBACK_EMERGENCY_ACTION
         else:
             # Human players program their robots interactively
             from robot_war.ui.programming import RobotProgrammingInterface
@@ -84,29 +92,12 @@ def main():
     terminal.print_centered(f"🔥 Starting battle...")
     time.sleep(1)
 
-    # Start battle
-    game.start_battle()
-
     # Start live display for smooth updates
     display.start_live_display()
     
     try:
-        # Run game loop with Rich visual display
-        while not game.is_game_over():
-            # Update display with current game state
-            display.update_live_display(game)
-            
-            # Wait briefly for user to see the state
-            time.sleep(1.5)
-            
-            # Execute turn
-            continues = game.execute_turn()
-            if not continues:
-                break
-
-        # If we hit the turn limit, determine winner
-        if not game.is_game_over():
-            game._determine_winner()
+        # Run the battle, refreshing the Rich display and pausing so the user can follow each turn
+        run_battle(game, on_turn=display.update_live_display, turn_delay=TURN_DELAY_SECONDS)
 
         # Final display update
         display.update_live_display(game)
@@ -0,0 +1,86 @@
+"""Headless battle runner - plays AI battles to completion without any terminal UI."""
+
+import argparse
+import random
+import time
+from typing import Callable, List, Optional, Sequence
+
+from robot_war.core.game_state import GameState
+from robot_war.ai.profiles import AIProfile, AIProfileLibrary, get_ai_robot_name
+
+
+def run_battle(game: GameState, on_turn: Optional[Callable[[GameState], None]] = None,
+               turn_delay: float = 0.0) -> Optional[int]:
+    """Run a configured game until it finishes. Returns the winner's player ID, or None.
+
+    on_turn is called before each turn (e.g. to refresh a display); turn_delay pauses after
+    it so a viewer can follow along. Headless runs leave both unset and run at full speed.
+    """
+    game.start_battle()
+
+    while not game.is_game_over():
+        if on_turn:
+            on_turn(game)
+        if turn_delay:
+            time.sleep(turn_delay)
+        if not game.execute_turn():
+            break
+
+    # execute_turn only stops early once a winner is decided, but guard against a wrong phase
+    if not game.is_game_over():
+        game._determine_winner()
+
+    return game.get_winner()
+
+
+def create_ai_battle(num_robots: int = 2, arena_size: int = 20, max_turns: int = 50,
+                     num_obstacles: int = 20, proximity_distance: int = 5,
+                     starting_energy: int = 1500,
+                     profiles: Optional[Sequence[AIProfile]] = None,
+                     rng: Optional[random.Random] = None) -> GameState:
+    """Create a game with AI robots and a generated arena; profiles default to a balanced team.
+
+    Pass a seeded random.Random as rng to make the team, names, arena and battle reproducible.
+    """
+    game = GameState(arena_width=arena_size, arena_height=arena_size, num_obstacles=num_obstacles,
+                     rng=rng)
+    game.max_turns = max_turns
+    game.proximity_distance = proximity_distance
+    game.starting_energy = starting_energy
+
+    if profiles is None:
+        profiles = AIProfileLibrary.get_balanced_team(num_robots, rng)
+
+    for player_id, profile in enumerate(profiles, start=1):
+        robot = game.add_robot(player_id, starting_energy, get_ai_robot_name(profile, rng))
+        robot.program = profile.program
+        robot.emergency_action = profile.emergency_action
+        robot.energy_threshold = profile.energy_threshold
+
+    game.setup_arena()
+    return game
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run one or more AI battles from the command line and print the results."""
+    parser = argparse.ArgumentParser(
+        description="Run Robot War AI battles without the terminal UI.")
+    parser.add_argument("--games", type=int, default=1, help="number of battles to run")
+    parser.add_argument("--robots", type=int, default=2, help="AI robots per battle")
+    parser.add_argument("--size", type=int, default=20, help="arena width and height")
+    parser.add_argument("--turns", type=int, default=50, help="maximum turns per battle")
+    parser.add_argument("--obstacles", type=int, default=20, help="obstacles per arena")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible runs")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    for game_number in range(1, args.games + 1):
+        game = create_ai_battle(args.robots, args.size, args.turns, args.obstacles, rng=rng)
+        winner_id = run_battle(game)
+        winner = next((robot for robot in game.robots if robot.player_id == winner_id), None)
+        result = f"{winner.name} (player {winner_id}) wins" if winner else "no survivors"
+        print(f"Game {game_number}: {result} after {game.current_turn} turns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Shared test fixtures for games with robots at known positions."""
+
+import unittest
+from robot_war.core.game_state import GameState
+from robot_war.core.robot import Robot
+
+
+def place_robot(game, robot, x=None, y=None):
+    """Put a robot at (x, y), or where it stands, registering it in game.robots and arena.robots."""
+    arena_robots = game.arena.robots
+    if arena_robots.get((robot.x, robot.y)) is robot:
+        del arena_robots[(robot.x, robot.y)]
+    if x is not None:
+        robot.set_position(x, y)
+    if robot not in game.robots:
+        game.robots.append(robot)
+    arena_robots[(robot.x, robot.y)] = robot
+    return robot
+
+
+class BaseTwoRobotTestCase(unittest.TestCase):
+    """Base test case: an obstacle-free 10x10 game with player 1 and player 2 robots placed."""
+
+    ROBOT1_POSITION = (5, 5)
+    ROBOT2_POSITION = (7, 5)
+
+    def setUp(self):
+        """Set up test game state with both robots at their class positions."""
+        # No random obstacles
+        self.game = GameState(arena_width=10, arena_height=10, num_obstacles=0)
+
+        self.robot1 = place_robot(self.game, Robot(1, *self.ROBOT1_POSITION, 1000))  # Player 1
+        self.robot2 = place_robot(self.game, Robot(2, *self.ROBOT2_POSITION, 1000))  # Player 2
@@ -1,7 +1,13 @@
 """Tests for AI robot profiles system."""
 
+import random
 import unittest
-from robot_war.ai.profiles import AIProfileLibrary, AIPersonality, get_ai_robot_name, validate_ai_program
+from dataclasses import fields, replace
+from robot_war.ai.profiles import (AIProfile, AIProfileLibrary, AIPersonality, get_ai_robot_name,
+                                   validate_ai_program)
+from robot_war.core.instructions import create_program_from_strings
+
+FIRING_OPS = {"FR", "FC"}
 
 
 class TestAIProfiles(unittest.TestCase):
@@ -10,31 +16,26 @@ class TestAIProfiles(unittest.TestCase):
     def test_all_profiles_exist(self):
         """Test that all expected AI profiles are available."""
         profiles = AIProfileLibrary.get_profiles()
-        expected_profiles = [
+        expected_profiles = {
             "berserker", "guardian", "hunter", "ghost", 
             "wanderer", "sniper", "trapper", "survivor"
-        ]
+        }
         
-        for profile_name in expected_profiles:
-            self.assertIn(profile_name, profiles)
-            
-        self.assertEqual(len(profiles), len(expected_profiles))
+        self.assertEqual(set(profiles), expected_profiles)
 
     def test_profile_completeness(self):
         """Test that each profile has all required attributes."""
         profiles = AIProfileLibrary.get_profiles()
+        required_fields = {
+            'name', 'personality', 'description', 'program', 'emergency_action',
+            'energy_threshold', 'preferred_names', 'strategy_notes'
+        }
+        
+        # Check required attributes exist in the profile schema
+        schema_fields = {schema_field.name for schema_field in fields(AIProfile)}
+        self.assertLessEqual(required_fields, schema_fields)
         
         for profile_name, profile in profiles.items():
-            # Check required attributes exist
-            self.assertTrue(hasattr(profile, 'name'))
-            self.assertTrue(hasattr(profile, 'personality'))
-            self.assertTrue(hasattr(profile, 'description'))
-            self.assertTrue(hasattr(profile, 'program'))
-            self.assertTrue(hasattr(profile, 'emergency_action'))
-            self.assertTrue(hasattr(profile, 'energy_threshold'))
-            self.assertTrue(hasattr(profile, 'preferred_names'))
-            self.assertTrue(hasattr(profile, 'strategy_notes'))
-            
             # Check program is not empty
             self.assertGreater(len(profile.program), 0)
             
@@ -54,6 +55,30 @@ class TestAIProfiles(unittest.TestCase):
                 self.assertTrue(validate_ai_program(profile.program), 
                                f"Invalid program in {profile_name}: {profile.program}")
 
+    def test_program_validation_rejects_unparseable(self):
+        """Test validation rejects any instruction the parser rejects."""
+        for program in (["DM(XYZ)"], ["PM", "PT(FR)"], ["XX"]):
+            with self.subTest(program=program):
+                self.assertFalse(validate_ai_program(program))
+
+    def test_program_parses(self):
+        """Test that every program instruction parses to its own mnemonic."""
+        profiles = AIProfileLibrary.get_profiles()
+        
+        for profile_name, profile in profiles.items():
+            with self.subTest(profile=profile_name):
+                instructions = create_program_from_strings(profile.program)
+                self.assertEqual([instruction.type.name for instruction in instructions],
+                                 [instr[:2] for instr in profile.program])
+
+    def test_invalid_program_rejected_at_load(self):
+        """Test that a corrupt profile program fails when the profile is built."""
+        berserker = AIProfileLibrary.get_profile_by_name("berserker")
+        with self.assertRaises(ValueError):
+            replace(berserker, program=("PM", "XX"))
+        with self.assertRaises(ValueError):
+            replace(berserker, emergency_action="PT(IN)")
+
     def test_personality_enum_coverage(self):
         """Test that all profiles have valid personality types."""
         profiles = AIProfileLibrary.get_profiles()
@@ -110,6 +135,20 @@ class TestAIProfiles(unittest.TestCase):
         unique_personalities = set(personalities_in_team)
         self.assertGreaterEqual(len(unique_personalities), min(4, len(AIPersonality)))
 
+    def test_get_balanced_team_rejects_negative_size(self):
+        """Test balanced team generation rejects a negative team size."""
+        with self.assertRaises(ValueError):
+            AIProfileLibrary.get_balanced_team(-1)
+
+    def test_get_balanced_team_seeded_rng(self):
+        """Test balanced team generation is reproducible with a seeded RNG."""
+        team_a = AIProfileLibrary.get_balanced_team(12, rng=random.Random(42))
+        team_b = AIProfileLibrary.get_balanced_team(12, rng=random.Random(42))
+        
+        self.assertEqual(team_a, team_b)
+        self.assertEqual(len(set(profile.personality for profile in team_a[:len(AIPersonality)])),
+                         len(AIPersonality))
+
     def test_get_ai_robot_name(self):
         """Test AI robot name generation."""
         berserker = AIProfileLibrary.get_profile_by_name("berserker")
@@ -142,7 +181,7 @@ class TestAIProfiles(unittest.TestCase):
         # Berserker should be aggressive
         berserker = AIProfileLibrary.get_profile_by_name("berserker")
         self.assertIn("PM", berserker.program)  # Should pursue enemies
-        self.assertTrue(any("FR" in instr or "FC" in instr for instr in berserker.program))  # Should fire
+        self.assertTrue(FIRING_OPS & set(berserker.program))  # Should fire
         
         # Guardian should be defensive
         guardian = AIProfileLibrary.get_profile_by_name("guardian")
@@ -1,9 +1,25 @@
 """Unit tests for Arena class - grid management, obstacles, mines, and positioning."""
 
 import unittest
-from robot_war.core.arena import Arena, CellType, Direction
+from robot_war.core.arena import Arena, CellType, Direction, NoEmptyPositionError
 from robot_war.core.robot import Robot
 
+# (direction, dx, dy) shared by the offset and movement tests
+DIRECTION_CASES = (
+    (Direction.N, 0, -1),
+    (Direction.NE, 1, -1),
+    (Direction.E, 1, 0),
+    (Direction.SE, 1, 1),
+    (Direction.S, 0, 1),
+    (Direction.SW, -1, 1),
+    (Direction.W, -1, 0),
+    (Direction.NW, -1, -1),
+)
+_DIRECTION_BY_OFFSET = {(dx, dy): direction for direction, dx, dy in DIRECTION_CASES}
+OPPOSITE_DIRECTIONS = {
+    direction: _DIRECTION_BY_OFFSET[(-dx, -dy)] for direction, dx, dy in DIRECTION_CASES
+}
+
 
 class TestArena(unittest.TestCase):
     """Test Arena grid management and positioning mechanics."""
@@ -20,9 +36,7 @@ class TestArena(unittest.TestCase):
         self.assertEqual(len(self.arena.grid[0]), 10)  # Width (columns)
         
         # All cells should start empty
-        for row in self.arena.grid:
-            for cell in row:
-                self.assertEqual(cell, CellType.EMPTY)
+        self.assertEqual(self.arena.grid, [[CellType.EMPTY] * 10 for _ in range(10)])
 
     def test_is_valid_position(self):
         """Test position validation within arena bounds."""
@@ -69,6 +83,15 @@ class TestArena(unittest.TestCase):
         self.arena.place_dead_robot(7, 7)
         self.assertEqual(self.arena.grid[7][7], CellType.DEAD_ROBOT)
 
+    def test_terrain_version(self):
+        """Test terrain version bumps only when passability changes."""
+        version = self.arena.terrain_version
+        self.arena.place_mine(1, 1, 1)
+        self.assertEqual(self.arena.terrain_version, version)
+        self.arena.place_obstacle(2, 2)
+        self.arena.place_dead_robot(3, 3)
+        self.assertEqual(self.arena.terrain_version, version + 2)
+
     def test_mine_placement_and_retrieval(self):
         """Test mine placement with ownership encoding."""
         # Place mine for player 1
@@ -88,6 +111,13 @@ class TestArena(unittest.TestCase):
         # Mine should be consumed after triggering
         self.assertFalse(self.arena.has_mine(5, 5))
 
+    def test_get_mine_does_not_trigger(self):
+        """Test peeking at a mine leaves it in place."""
+        self.arena.place_mine(5, 5, 2, 200)
+        self.assertEqual(self.arena.get_mine(5, 5), (20, 200))
+        self.assertTrue(self.arena.has_mine(5, 5))
+        self.assertIsNone(self.arena.get_mine(5, 6))
+
     def test_mine_trigger_nonexistent(self):
         """Test triggering mine at position with no mine."""
         result = self.arena.trigger_mine(5, 5)
@@ -95,20 +125,9 @@ class TestArena(unittest.TestCase):
 
     def test_direction_offsets(self):
         """Test direction offset calculations."""
-        test_cases = [
-            (Direction.N, (0, -1)),
-            (Direction.NE, (1, -1)),
-            (Direction.E, (1, 0)),
-            (Direction.SE, (1, 1)),
-            (Direction.S, (0, 1)),
-            (Direction.SW, (-1, 1)),
-            (Direction.W, (-1, 0)),
-            (Direction.NW, (-1, -1)),
-        ]
-        
-        for direction, expected_offset in test_cases:
-            offset = self.arena.get_direction_offset(direction)
-            self.assertEqual(offset, expected_offset)
+        for direction, dx, dy in DIRECTION_CASES:
+            with self.subTest(direction=direction):
+                self.assertEqual(self.arena.get_direction_offset(direction), (dx, dy))
 
     def test_adjacent_positions(self):
         """Test getting adjacent positions (8-directional)."""
@@ -159,8 +178,14 @@ class TestArena(unittest.TestCase):
             for x in range(10):
                 self.arena.place_obstacle(x, y)
         
-        with self.assertRaises(Exception):
+        with self.assertRaises(NoEmptyPositionError):
             self.arena.get_random_empty_position()
+        
+        # Excluding the last free cell also leaves no candidates
+        arena = Arena(width=2, height=1)
+        arena.place_obstacle(0, 0)
+        with self.assertRaises(NoEmptyPositionError):
+            arena.get_random_empty_position({(1, 0)})
 
     def test_obstacle_generation(self):
         """Test random obstacle generation."""
@@ -168,11 +193,7 @@ class TestArena(unittest.TestCase):
         self.arena.generate_obstacles(obstacle_count)
         
         # Count placed obstacles
-        placed_obstacles = 0
-        for row in self.arena.grid:
-            for cell in row:
-                if cell == CellType.OBSTACLE:
-                    placed_obstacles += 1
+        placed_obstacles = sum(row.count(CellType.OBSTACLE) for row in self.arena.grid)
         
         self.assertEqual(placed_obstacles, obstacle_count)
 
@@ -217,21 +238,9 @@ class TestArena(unittest.TestCase):
 
     def test_get_move_towards(self):
         """Test calculating direction to move towards target."""
-        test_cases = [
-            # (from_x, from_y, to_x, to_y, expected_direction)
-            (5, 5, 5, 4, Direction.N),    # North
-            (5, 5, 6, 4, Direction.NE),   # Northeast
-            (5, 5, 6, 5, Direction.E),    # East
-            (5, 5, 6, 6, Direction.SE),   # Southeast
-            (5, 5, 5, 6, Direction.S),    # South
-            (5, 5, 4, 6, Direction.SW),   # Southwest
-            (5, 5, 4, 5, Direction.W),    # West
-            (5, 5, 4, 4, Direction.NW),   # Northwest
-        ]
-        
-        for from_x, from_y, to_x, to_y, expected in test_cases:
-            result = self.arena.get_move_towards(from_x, from_y, to_x, to_y)
-            self.assertEqual(result, expected)
+        for direction, dx, dy in DIRECTION_CASES:
+            with self.subTest(direction=direction):
+                self.assertEqual(self.arena.get_move_towards(5, 5, 5 + dx, 5 + dy), direction)
         
         # Same position should return None
         result = self.arena.get_move_towards(5, 5, 5, 5)
@@ -248,21 +257,11 @@ class TestArena(unittest.TestCase):
 
     def test_get_move_away(self):
         """Test calculating direction to move away from target."""
-        test_cases = [
-            # (from_x, from_y, avoid_x, avoid_y, expected_direction)
-            (5, 5, 5, 4, Direction.S),    # Away from North = South
-            (5, 5, 6, 4, Direction.SW),   # Away from Northeast = Southwest
-            (5, 5, 6, 5, Direction.W),    # Away from East = West
-            (5, 5, 6, 6, Direction.NW),   # Away from Southeast = Northwest
-            (5, 5, 5, 6, Direction.N),    # Away from South = North
-            (5, 5, 4, 6, Direction.NE),   # Away from Southwest = Northeast
-            (5, 5, 4, 5, Direction.E),    # Away from West = East
-            (5, 5, 4, 4, Direction.SE),   # Away from Northwest = Southeast
-        ]
-        
-        for from_x, from_y, avoid_x, avoid_y, expected in test_cases:
-            result = self.arena.get_move_away(from_x, from_y, avoid_x, avoid_y)
-            self.assertEqual(result, expected)
+        for direction, dx, dy in DIRECTION_CASES:
+            with self.subTest(direction=direction):
+                # Moving away from a neighbour means heading the opposite way, e.g. away from N is S
+                self.assertEqual(self.arena.get_move_away(5, 5, 5 + dx, 5 + dy),
+                                 OPPOSITE_DIRECTIONS[direction])
         
         # Same position should return None
         result = self.arena.get_move_away(5, 5, 5, 5)
@@ -4,6 +4,15 @@ import unittest
 from robot_war.core.game_state import GameState
 from robot_war.core.robot import Robot, RobotStatus
 from robot_war.core.instructions import InstructionSet, InstructionType
+from robot_war.tests._fixtures import place_robot
+
+# (emergency_action, initial_energy, expected_energy_cost, expected_status)
+EMERGENCY_ACTION_CASES = (
+    ("RM", 300, 5, RobotStatus.ALIVE),          # Random move
+    ("DM(S)", 300, 5, RobotStatus.ALIVE),       # Directed move
+    ("IN", 300, 200, RobotStatus.INVISIBLE),    # Invisibility
+    ("MI", 250, 200, RobotStatus.ALIVE),        # Mine placement - use 250 energy to avoid death
+)
 
 
 class TestEmergencyRoutines(unittest.TestCase):
@@ -11,15 +20,11 @@ class TestEmergencyRoutines(unittest.TestCase):
 
     def setUp(self):
         """Set up test game state with robots."""
-        self.game = GameState(arena_width=10, arena_height=10)
-        self.game.num_obstacles = 0  # No random obstacles for predictable tests
+        # No random obstacles
+        self.game = GameState(arena_width=10, arena_height=10, num_obstacles=0)
         
         # Add robot at known position
-        self.robot = self.game.add_robot(1, 1000)
-        self.robot.set_position(5, 5)
-        
-        # Update arena robot tracking
-        self.game.arena.robots = {(5, 5): self.robot}
+        self.robot = place_robot(self.game, Robot(1, 5, 5, 1000))
 
     def test_emergency_threshold_initialization(self):
         """Test that emergency threshold is set correctly on robot creation."""
@@ -27,6 +32,7 @@ class TestEmergencyRoutines(unittest.TestCase):
         expected_threshold = max(InstructionSet.ENERGY_COSTS.values()) + 10
         self.assertEqual(self.robot.emergency_energy_threshold, expected_threshold)
         self.assertEqual(expected_threshold, 210)  # MI/IN cost 200, +10 buffer
+        self.assertEqual(Robot.DEFAULT_EMERGENCY_THRESHOLD, expected_threshold)
 
     def test_emergency_action_initialization(self):
         """Test that emergency action starts as None."""
@@ -107,26 +113,20 @@ class TestEmergencyRoutines(unittest.TestCase):
 
     def test_emergency_action_execution_types(self):
         """Test different types of emergency actions."""
-        test_cases = [
-            # (emergency_action, initial_energy, expected_energy_cost, expected_status)
-            ("RM", 300, 5, RobotStatus.ALIVE),          # Random move
-            ("DM(S)", 300, 5, RobotStatus.ALIVE),       # Directed move
-            ("IN", 300, 200, RobotStatus.INVISIBLE),    # Invisibility
-            ("MI", 250, 200, RobotStatus.ALIVE),        # Mine placement - use 250 energy to avoid death
-        ]
+        robots = self.game.arena.robots
+        mines = self.game.arena.mines
         
-        for emergency_action, initial_energy, expected_cost, expected_status in test_cases:
+        for emergency_action, initial_energy, expected_cost, expected_status in (
+                EMERGENCY_ACTION_CASES):
             with self.subTest(emergency_action=emergency_action):
-                # Reset robot state
+                # Reset robot state in place, reusing the arena's dicts
                 self.robot.energy = initial_energy
                 self.robot.status = RobotStatus.ALIVE
                 self.robot.emergency_action = emergency_action
                 self.robot.set_position(5, 5)
-                self.game.arena.robots = {(5, 5): self.robot}
-                self.game.arena.mines.clear()  # Clear any mines from previous tests
-                
-                # Set energy to initial energy
-                self.robot.energy = initial_energy
+                robots.clear()
+                robots[(5, 5)] = self.robot
+                mines.clear()  # Clear any mines from previous cases
                 
                 # Execute emergency routine directly
                 self.game._execute_emergency_routine(self.robot)
@@ -259,9 +259,7 @@ class TestEmergencyRoutines(unittest.TestCase):
     def test_multiple_robots_emergency_independence(self):
         """Test that each robot's emergency system works independently."""
         # Add second robot
-        robot2 = self.game.add_robot(2, 1000)
-        robot2.set_position(7, 7)
-        self.game.arena.robots[(7, 7)] = robot2
+        robot2 = place_robot(self.game, Robot(2, 7, 7, 1000))
         
         # Set different emergency conditions
         self.robot.energy = 50  # Below threshold, no emergency action
@@ -4,6 +4,23 @@ import unittest
 from robot_war.core.game_state import GameState
 from robot_war.core.robot import Robot, RobotStatus
 from robot_war.core.instructions import InstructionSet, InstructionType
+from robot_war.tests._fixtures import place_robot
+
+# Parsed once at import rather than in each test body
+PT_FR_RM = InstructionSet.parse_instruction("PT(FR,RM)")
+PT_FC_IN = InstructionSet.parse_instruction("PT(FC,IN)")
+PT_FR_IN = InstructionSet.parse_instruction("PT(FR,IN)")
+
+
+class TestFireInstructionMetadata(unittest.TestCase):
+    """Test FR/FC cost and damage tables; these need no game fixture."""
+
+    def test_energy_cost_and_damage(self):
+        """Test FR and FC energy cost and damage values."""
+        for instruction_type in (InstructionType.FR, InstructionType.FC):
+            with self.subTest(instruction=instruction_type.name):
+                self.assertEqual(InstructionSet.get_energy_cost(instruction_type), 100)
+                self.assertEqual(InstructionSet.get_damage(instruction_type), 200)
 
 
 class TestFireInstructions(unittest.TestCase):
@@ -11,153 +28,91 @@ class TestFireInstructions(unittest.TestCase):
 
     def setUp(self):
         """Set up test game state with robots and obstacles."""
-        self.game = GameState(arena_width=10, arena_height=10)
-        self.game.num_obstacles = 0  # No random obstacles for predictable tests
+        # No random obstacles
+        self.game = GameState(arena_width=10, arena_height=10, num_obstacles=0)
         self.game.proximity_distance = 5  # Set proximity distance for firing range
         
-        # Add test robots
-        self.shooter = self.game.add_robot(1, 1000)  # Player 1 (shooter)
-        self.target1 = self.game.add_robot(2, 1000)  # Player 2 (target)
-        self.target2 = self.game.add_robot(3, 1000)  # Player 3 (target)
-        
-        # Clear arena robots dict and set manually for predictable tests
-        self.game.arena.robots.clear()
-
-    def test_fr_energy_cost(self):
-        """Test FR instruction energy cost."""
-        fr_cost = InstructionSet.get_energy_cost(InstructionType.FR)
-        self.assertEqual(fr_cost, 100)
-
-    def test_fc_energy_cost(self):
-        """Test FC instruction energy cost."""
-        fc_cost = InstructionSet.get_energy_cost(InstructionType.FC)
-        self.assertEqual(fc_cost, 100)
-
-    def test_fr_damage_value(self):
-        """Test FR instruction damage value."""
-        fr_damage = InstructionSet.get_damage(InstructionType.FR)
-        self.assertEqual(fr_damage, 200)
-
-    def test_fc_damage_value(self):
-        """Test FC instruction damage value."""
-        fc_damage = InstructionSet.get_damage(InstructionType.FC)
-        self.assertEqual(fc_damage, 200)
+        # Build test robots directly; each test places the ones it needs
+        self.shooter = Robot(1, 0, 0, 1000)  # Player 1 (shooter)
+        self.target1 = Robot(2, 1, 0, 1000)  # Player 2 (target)
+        self.target2 = Robot(3, 2, 0, 1000)  # Player 3 (target)
 
     def test_fr_hits_left_target(self):
         """Test FR fires left and hits target."""
-        # Setup: shooter at (5,5), target at (2,5) - same row, left side
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(2, 5)
-        self.game.arena.robots = {(5, 5): self.shooter, (2, 5): self.target1}
-        
-        original_target_energy = self.target1.energy
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 2, 5)
         
-        # Execute FR
         self.game._fire_row(self.shooter)
         
-        # Target should take 200 damage
-        expected_energy = original_target_energy - 200
-        self.assertEqual(self.target1.energy, expected_energy)
+        self.assertEqual(self.target1.energy, 1000 - 200)
 
     def test_fr_hits_right_target(self):
         """Test FR fires right and hits target."""
-        # Setup: shooter at (5,5), target at (8,5) - same row, right side
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(8, 5)
-        self.game.arena.robots = {(5, 5): self.shooter, (8, 5): self.target1}
-        
-        original_target_energy = self.target1.energy
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 8, 5)
         
-        # Execute FR
         self.game._fire_row(self.shooter)
         
-        # Target should take 200 damage
-        expected_energy = original_target_energy - 200
-        self.assertEqual(self.target1.energy, expected_energy)
+        self.assertEqual(self.target1.energy, 1000 - 200)
 
     def test_fr_hits_both_sides(self):
         """Test FR hits targets on both left and right sides."""
-        # Setup: shooter at (5,5), targets at (2,5) and (8,5)
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(2, 5)  # Left target
-        self.target2.set_position(8, 5)  # Right target
-        self.game.arena.robots = {
-            (5, 5): self.shooter,
-            (2, 5): self.target1,
-            (8, 5): self.target2
-        }
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 2, 5)  # Left target
+        place_robot(self.game, self.target2, 8, 5)  # Right target
         
-        original_energy1 = self.target1.energy
-        original_energy2 = self.target2.energy
-        
-        # Execute FR
         self.game._fire_row(self.shooter)
         
-        # Both targets should take 200 damage
-        self.assertEqual(self.target1.energy, original_energy1 - 200)
-        self.assertEqual(self.target2.energy, original_energy2 - 200)
+        self.assertEqual(self.target1.energy, 1000 - 200)
+        self.assertEqual(self.target2.energy, 1000 - 200)
 
     def test_fc_hits_up_target(self):
         """Test FC fires up and hits target."""
-        # Setup: shooter at (5,5), target at (5,2) - same column, above
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(5, 2)
-        self.game.arena.robots = {(5, 5): self.shooter, (5, 2): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 5, 2)
         
-        original_target_energy = self.target1.energy
-        
-        # Execute FC
         self.game._fire_column(self.shooter)
         
-        # Target should take 200 damage
-        expected_energy = original_target_energy - 200
-        self.assertEqual(self.target1.energy, expected_energy)
+        self.assertEqual(self.target1.energy, 1000 - 200)
 
     def test_fc_hits_down_target(self):
         """Test FC fires down and hits target."""
-        # Setup: shooter at (5,5), target at (5,8) - same column, below
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(5, 8)
-        self.game.arena.robots = {(5, 5): self.shooter, (5, 8): self.target1}
-        
-        original_target_energy = self.target1.energy
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 5, 8)
         
-        # Execute FC
         self.game._fire_column(self.shooter)
         
-        # Target should take 200 damage
-        expected_energy = original_target_energy - 200
-        self.assertEqual(self.target1.energy, expected_energy)
+        self.assertEqual(self.target1.energy, 1000 - 200)
 
     def test_fc_hits_both_directions(self):
         """Test FC hits targets both up and down."""
-        # Setup: shooter at (5,5), targets at (5,2) and (5,8)
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(5, 2)  # Up target
-        self.target2.set_position(5, 8)  # Down target
-        self.game.arena.robots = {
-            (5, 5): self.shooter,
-            (5, 2): self.target1,
-            (5, 8): self.target2
-        }
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 5, 2)  # Up target
+        place_robot(self.game, self.target2, 5, 8)  # Down target
         
-        original_energy1 = self.target1.energy
-        original_energy2 = self.target2.energy
-        
-        # Execute FC
         self.game._fire_column(self.shooter)
         
-        # Both targets should take 200 damage
-        self.assertEqual(self.target1.energy, original_energy1 - 200)
-        self.assertEqual(self.target2.energy, original_energy2 - 200)
+        self.assertEqual(self.target1.energy, 1000 - 200)
+        self.assertEqual(self.target2.energy, 1000 - 200)
+
+    def test_fr_combat_log_lines(self):
+        """Test FR records structured log entries formatted on demand."""
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 2, 5)
+        
+        self.game._fire_row(self.shooter)
+        
+        self.assertEqual(self.game.get_combat_log_lines(), [
+            f"{self.shooter.name} fires FR from (5,5)",
+            f"  → hits {self.target1.name} at (2,5) - damaged for 200",
+        ])
 
     def test_fr_range_limitation(self):
         """Test FR respects proximity distance range limit."""
         # Setup: shooter at (5,5), target at (0,5) - distance 5 (at boundary)
         self.game.proximity_distance = 5
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(0, 5)  # Distance = 5
-        self.game.arena.robots = {(5, 5): self.shooter, (0, 5): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 0, 5)  # Distance = 5
         
         original_target_energy = self.target1.energy
         
@@ -167,9 +122,7 @@ class TestFireInstructions(unittest.TestCase):
         
         # Reset target health and move it beyond range
         self.target1.energy = 1000
-        self.target1.set_position(0, 4)  # Different row, same distance but wrong direction
-        del self.game.arena.robots[(0, 5)]
-        self.game.arena.robots[(0, 4)] = self.target1
+        place_robot(self.game, self.target1, 0, 4)  # Different row, same distance
         
         # Execute FR - should not hit (different row)
         self.game._fire_row(self.shooter)
@@ -178,9 +131,8 @@ class TestFireInstructions(unittest.TestCase):
     def test_fr_obstacle_blocking(self):
         """Test FR shots are blocked by obstacles."""
         # Setup: shooter at (5,5), obstacle at (3,5), target at (1,5)
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(1, 5)
-        self.game.arena.robots = {(5, 5): self.shooter, (1, 5): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 1, 5)
         
         # Place obstacle between shooter and target
         self.game.arena.place_obstacle(3, 5)
@@ -196,9 +148,8 @@ class TestFireInstructions(unittest.TestCase):
     def test_fc_obstacle_blocking(self):
         """Test FC shots are blocked by obstacles."""
         # Setup: shooter at (5,5), obstacle at (5,3), target at (5,1)
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(5, 1)
-        self.game.arena.robots = {(5, 5): self.shooter, (5, 1): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 5, 1)
         
         # Place obstacle between shooter and target
         self.game.arena.place_obstacle(5, 3)
@@ -214,14 +165,9 @@ class TestFireInstructions(unittest.TestCase):
     def test_fr_stops_at_first_target(self):
         """Test FR stops at first target hit, doesn't continue through."""
         # Setup: shooter at (5,5), target1 at (3,5), target2 at (1,5)
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(3, 5)  # Closer target
-        self.target2.set_position(1, 5)  # Further target behind target1
-        self.game.arena.robots = {
-            (5, 5): self.shooter,
-            (3, 5): self.target1,
-            (1, 5): self.target2
-        }
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 3, 5)  # Closer target
+        place_robot(self.game, self.target2, 1, 5)  # Further target behind target1
         
         original_energy1 = self.target1.energy
         original_energy2 = self.target2.energy
@@ -236,10 +182,9 @@ class TestFireInstructions(unittest.TestCase):
     def test_fr_ignores_own_team(self):
         """Test FR doesn't hit robots from same player."""
         # Setup: two robots from same player in firing line
-        teammate = self.game.add_robot(1, 1000)  # Same player ID as shooter
-        self.shooter.set_position(5, 5)
-        teammate.set_position(3, 5)  # Same row as shooter
-        self.game.arena.robots = {(5, 5): self.shooter, (3, 5): teammate}
+        teammate = Robot(1, 3, 5, 1000)  # Same player ID as shooter
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, teammate)  # Same row as shooter
         
         original_teammate_energy = teammate.energy
         
@@ -252,10 +197,9 @@ class TestFireInstructions(unittest.TestCase):
     def test_fire_instructions_kill_target(self):
         """Test FR/FC properly handle target death."""
         # Setup: target with low health
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(3, 5)
         self.target1.energy = 100  # Less than FR damage (200)
-        self.game.arena.robots = {(5, 5): self.shooter, (3, 5): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 3, 5)
         
         # Execute FR
         self.game._fire_row(self.shooter)
@@ -267,73 +211,43 @@ class TestFireInstructions(unittest.TestCase):
         # Check if skull/dead robot obstacle was placed
         self.assertFalse(self.game.arena.is_passable(3, 5))
 
+    def _execute_pt(self, instruction):
+        """Deduct the PT cost as the main execution loop does, then run the conditional."""
+        self.assertIsNotNone(instruction)
+        self.shooter.use_energy(InstructionSet.get_energy_cost(InstructionType.PT))
+        self.game._execute_proximity_test_conditional(self.shooter, instruction)
+
     def test_pt_fr_conditional_execution(self):
         """Test PT(FR,RM) - fire if enemy detected, random move otherwise."""
-        # Setup: robots close enough for proximity detection
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(3, 5)  # Close target for proximity
-        self.game.arena.robots = {(5, 5): self.shooter, (3, 5): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 3, 5)
         self.game.proximity_distance = 3
         
-        original_target_energy = self.target1.energy
-        
-        # Execute PT(FR,RM) instruction - simulate full execution with energy deduction
-        instruction = InstructionSet.parse_instruction("PT(FR,RM)")
-        self.assertIsNotNone(instruction)
-        pt_cost = InstructionSet.get_energy_cost(InstructionType.PT)
+        self._execute_pt(PT_FR_RM)
         
-        # Deduct PT cost first (as done in main execution loop)
-        self.shooter.use_energy(pt_cost)
-        self.game._execute_proximity_test_conditional(self.shooter, instruction)
-        
-        # Should execute FR (enemy detected), target should take damage
-        self.assertEqual(self.target1.energy, original_target_energy - 200)
+        self.assertEqual(self.target1.energy, 1000 - 200)
 
     def test_pt_fc_conditional_execution(self):
         """Test PT(FC,IN) - fire if enemy detected, go invisible otherwise."""
-        # Setup: robots close enough for proximity detection
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(5, 3)  # Close target in same column
-        self.game.arena.robots = {(5, 5): self.shooter, (5, 3): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 5, 3)
         self.game.proximity_distance = 3
         
-        original_target_energy = self.target1.energy
-        
-        # Execute PT(FC,IN) instruction - simulate full execution with energy deduction
-        instruction = InstructionSet.parse_instruction("PT(FC,IN)")
-        self.assertIsNotNone(instruction)
-        pt_cost = InstructionSet.get_energy_cost(InstructionType.PT)
-        
-        # Deduct PT cost first (as done in main execution loop)
-        self.shooter.use_energy(pt_cost)
-        self.game._execute_proximity_test_conditional(self.shooter, instruction)
+        self._execute_pt(PT_FC_IN)
         
-        # Should execute FC (enemy detected), target should take damage
-        self.assertEqual(self.target1.energy, original_target_energy - 200)
+        self.assertEqual(self.target1.energy, 1000 - 200)
+        self.assertEqual(self.shooter.status, RobotStatus.ALIVE)
 
     def test_pt_false_branch_no_firing(self):
         """Test PT doesn't execute FR/FC when no enemies detected."""
-        # Setup: no nearby enemies
-        self.shooter.set_position(5, 5)
-        self.target1.set_position(0, 0)  # Far away target
-        self.game.arena.robots = {(5, 5): self.shooter, (0, 0): self.target1}
+        place_robot(self.game, self.shooter, 5, 5)
+        place_robot(self.game, self.target1, 0, 0)
         self.game.proximity_distance = 3
         
-        original_target_energy = self.target1.energy
-        original_shooter_status = self.shooter.status
-        
-        # Execute PT(FR,IN) instruction - simulate full execution with energy deduction
-        instruction = InstructionSet.parse_instruction("PT(FR,IN)")
-        pt_cost = InstructionSet.get_energy_cost(InstructionType.PT)
-        
-        # Deduct PT cost first (as done in main execution loop)
-        self.shooter.use_energy(pt_cost)
-        # Then execute the conditional
-        self.game._execute_proximity_test_conditional(self.shooter, instruction)
+        self._execute_pt(PT_FR_IN)
         
-        # Should execute IN (no enemy detected), not FR
-        self.assertEqual(self.target1.energy, original_target_energy)  # No damage
-        self.assertEqual(self.shooter.status, RobotStatus.INVISIBLE)  # Shooter went invisible
+        self.assertEqual(self.target1.energy, 1000)
+        self.assertEqual(self.shooter.status, RobotStatus.INVISIBLE)
 
 
 if __name__ == '__main__':
@@ -1,9 +1,18 @@
 """Unit tests for GameState class - comprehensive coverage."""
 
 import unittest
+from robot_war.core.arena import CellType, Direction
 from robot_war.core.game_state import GameState, GamePhase
 from robot_war.core.robot import Robot, RobotStatus
 from robot_war.core.instructions import InstructionSet
+from robot_war.tests._fixtures import place_robot
+
+# (case, starting energies, damage dealt to each robot, index of the expected winner or None)
+DETERMINE_WINNER_CASES = (
+    ("no-survivors", (1000, 1000), (1000, 1000), None),
+    ("last-robot-standing", (1000, 1000), (0, 1000), 0),
+    ("highest-energy", (800, 1200, 600), (0, 0, 0), 1),
+)
 
 
 class TestGameState(unittest.TestCase):
@@ -11,8 +20,8 @@ class TestGameState(unittest.TestCase):
 
     def setUp(self):
         """Set up test game state."""
-        self.game = GameState(arena_width=10, arena_height=10)
-        self.game.num_obstacles = 0  # No random obstacles for predictable tests
+        # No random obstacles
+        self.game = GameState(arena_width=10, arena_height=10, num_obstacles=0)
 
     def test_add_robot_with_default_energy(self):
         """Test adding robot uses default starting energy when None provided."""
@@ -26,52 +35,15 @@ class TestGameState(unittest.TestCase):
         robot = self.game.add_robot(1, custom_energy)
         self.assertEqual(robot.energy, custom_energy)
 
-    def test_start_programming_from_setup(self):
-        """Test transitioning from SETUP to PROGRAMMING phase."""
-        self.assertEqual(self.game.phase, GamePhase.SETUP)
-        self.game.start_programming()
-        self.assertEqual(self.game.phase, GamePhase.PROGRAMMING)
-
-    def test_start_programming_from_wrong_phase(self):
-        """Test start_programming() does nothing if not in SETUP phase."""
-        self.game.phase = GamePhase.BATTLE
-        self.game.start_programming()
-        self.assertEqual(self.game.phase, GamePhase.BATTLE)  # Should not change
-
-    def test_start_battle_from_setup(self):
-        """Test transitioning from SETUP to BATTLE phase."""
-        self.game.start_battle()
-        self.assertEqual(self.game.phase, GamePhase.BATTLE)
-        self.assertEqual(self.game.current_turn, 0)
-
-    def test_start_battle_from_programming(self):
-        """Test transitioning from PROGRAMMING to BATTLE phase."""
-        self.game.phase = GamePhase.PROGRAMMING
-        self.game.start_battle()
-        self.assertEqual(self.game.phase, GamePhase.BATTLE)
-        self.assertEqual(self.game.current_turn, 0)
-
-    def test_start_battle_from_wrong_phase(self):
-        """Test start_battle() does nothing if already in BATTLE or FINISHED."""
-        self.game.phase = GamePhase.FINISHED
-        original_turn = self.game.current_turn
-        self.game.start_battle()
-        self.assertEqual(self.game.phase, GamePhase.FINISHED)
-        self.assertEqual(self.game.current_turn, original_turn)
-
-    def test_execute_turn_wrong_phase(self):
-        """Test execute_turn() returns False if not in BATTLE phase."""
-        self.game.phase = GamePhase.SETUP
-        result = self.game.execute_turn()
-        self.assertFalse(result)
-
-        self.game.phase = GamePhase.PROGRAMMING
-        result = self.game.execute_turn()
-        self.assertFalse(result)
-
-        self.game.phase = GamePhase.FINISHED
-        result = self.game.execute_turn()
-        self.assertFalse(result)
+    def test_setup_arena_uses_constructor_obstacle_count(self):
+        """Test setup_arena() places the number of obstacles given to the constructor."""
+        game = GameState(arena_width=10, arena_height=10, num_obstacles=7)
+        game.add_robot(1, 1000)
+        game.setup_arena()
+        self.assertEqual(sum(row.count(CellType.OBSTACLE) for row in game.arena.grid), 7)
+        
+        self.game.setup_arena()  # Built with num_obstacles=0
+        self.assertEqual(sum(row.count(CellType.OBSTACLE) for row in self.game.arena.grid), 0)
 
     def test_execute_turn_one_robot_left(self):
         """Test execute_turn() ends game when only one robot remains."""
@@ -120,64 +92,39 @@ class TestGameState(unittest.TestCase):
         self.assertEqual(self.game.current_turn, original_turn + 1)
         self.assertEqual(self.game.phase, GamePhase.BATTLE)
 
-    def test_determine_winner_no_survivors(self):
-        """Test winner determination when no robots survive."""
+    def test_execute_turn_all_robots_frozen(self):
+        """Test execute_turn() ends game early when no living robot can act."""
         robot1 = self.game.add_robot(1, 1000)
-        robot2 = self.game.add_robot(2, 1000)
-        
-        # Kill both robots
-        robot1.take_damage(1000)
-        robot2.take_damage(1000)
-        
-        self.game._determine_winner()
-        
-        self.assertIsNone(self.game.winner_id)
-        self.assertEqual(self.game.phase, GamePhase.FINISHED)
-
-    def test_determine_winner_last_robot_standing(self):
-        """Test winner determination with one survivor."""
-        robot1 = self.game.add_robot(1, 1000)
-        robot2 = self.game.add_robot(2, 1000)
-        
-        # Kill robot2
-        robot2.take_damage(1000)
-        
-        self.game._determine_winner()
-        
-        self.assertEqual(self.game.winner_id, robot1.player_id)
-        self.assertEqual(self.game.phase, GamePhase.FINISHED)
-
-    def test_determine_winner_highest_energy(self):
-        """Test winner determination by highest energy."""
-        robot1 = self.game.add_robot(1, 800)
-        robot2 = self.game.add_robot(2, 1200)
-        robot3 = self.game.add_robot(3, 600)
+        robot2 = self.game.add_robot(2, 800)
+        robot1.program = ["RM"]
+        robot2.program = ["RM"]
+        robot1.status = RobotStatus.FROZEN
+        robot2.status = RobotStatus.FROZEN
         
-        self.game._determine_winner()
+        self.game.start_battle()
+        result = self.game.execute_turn()
         
-        self.assertEqual(self.game.winner_id, robot2.player_id)  # Highest energy
+        self.assertFalse(result)  # Game should end
         self.assertEqual(self.game.phase, GamePhase.FINISHED)
-
-    def test_is_game_over_true(self):
-        """Test is_game_over() returns True when game finished."""
-        self.game.phase = GamePhase.FINISHED
-        self.assertTrue(self.game.is_game_over())
-
-    def test_is_game_over_false(self):
-        """Test is_game_over() returns False when game not finished."""
-        for phase in [GamePhase.SETUP, GamePhase.PROGRAMMING, GamePhase.BATTLE]:
-            self.game.phase = phase
-            self.assertFalse(self.game.is_game_over())
-
-    def test_get_winner_with_winner(self):
-        """Test get_winner() returns winner ID."""
-        self.game.winner_id = 5
-        self.assertEqual(self.game.get_winner(), 5)
-
-    def test_get_winner_no_winner(self):
-        """Test get_winner() returns None when no winner."""
-        self.game.winner_id = None
-        self.assertIsNone(self.game.get_winner())
+        self.assertEqual(self.game.current_turn, 0)
+        self.assertEqual(self.game.winner_id, robot1.player_id)  # Highest energy wins
+
+    def test_determine_winner(self):
+        """Test winner determination: last robot standing, else highest energy, else no winner."""
+        for case, energies, damages, expected_index in DETERMINE_WINNER_CASES:
+            with self.subTest(case=case):
+                self.game = GameState(arena_width=10, arena_height=10, num_obstacles=0)
+                robots = [self.game.add_robot(player_id, energy)
+                          for player_id, energy in enumerate(energies, start=1)]
+                for robot, damage in zip(robots, damages):
+                    robot.take_damage(damage)
+                
+                self.game._determine_winner()
+                
+                expected_winner = (None if expected_index is None
+                                   else robots[expected_index].player_id)
+                self.assertEqual(self.game.winner_id, expected_winner)
+                self.assertEqual(self.game.phase, GamePhase.FINISHED)
 
     def test_get_game_stats(self):
         """Test get_game_stats() returns correct statistics."""
@@ -202,46 +149,35 @@ class TestGameState(unittest.TestCase):
 
     def test_find_nearest_enemy_basic(self):
         """Test _find_nearest_enemy() finds closest enemy."""
-        robot1 = self.game.add_robot(1, 1000)
-        robot2 = self.game.add_robot(2, 1000)
-        robot3 = self.game.add_robot(2, 1000)  # Same team as robot2
-        
-        robot1.set_position(5, 5)
-        robot2.set_position(7, 5)  # Distance 2
-        robot3.set_position(9, 5)  # Distance 4
+        robot1 = place_robot(self.game, Robot(1, 5, 5, 1000))
+        robot2 = place_robot(self.game, Robot(2, 7, 5, 1000))  # Distance 2
+        place_robot(self.game, Robot(2, 9, 5, 1000))  # Same team as robot2, distance 4
         
         nearest = self.game._find_nearest_enemy(robot1)
-        self.assertEqual(nearest, robot2)  # Closer enemy
+        self.assertIs(nearest, robot2)
 
     def test_find_nearest_enemy_ignores_self(self):
         """Test _find_nearest_enemy() ignores same player robots."""
-        robot1 = self.game.add_robot(1, 1000)
-        robot2 = self.game.add_robot(1, 1000)  # Same player
-        robot3 = self.game.add_robot(2, 1000)  # Different player
-        
-        robot1.set_position(5, 5)
-        robot2.set_position(6, 5)  # Closer but same team
-        robot3.set_position(8, 5)  # Further but enemy
+        robot1 = place_robot(self.game, Robot(1, 5, 5, 1000))
+        place_robot(self.game, Robot(1, 6, 5, 1000))  # Closer but same team
+        robot3 = place_robot(self.game, Robot(2, 8, 5, 1000))  # Further but enemy
         
         nearest = self.game._find_nearest_enemy(robot1)
-        self.assertEqual(nearest, robot3)  # Should find robot3, not robot2
+        self.assertIs(nearest, robot3)
 
     def test_find_nearest_enemy_ignores_invisible(self):
         """Test _find_nearest_enemy() ignores invisible robots."""
-        robot1 = self.game.add_robot(1, 1000)
-        robot2 = self.game.add_robot(2, 1000)
-        
-        robot1.set_position(5, 5)
-        robot2.set_position(6, 5)
+        robot1 = place_robot(self.game, Robot(1, 5, 5, 1000))
+        robot2 = place_robot(self.game, Robot(2, 6, 5, 1000))
         robot2.status = RobotStatus.INVISIBLE
         
         nearest = self.game._find_nearest_enemy(robot1)
-        self.assertIsNone(nearest)  # Should not find invisible robot
+        self.assertIsNone(nearest)
 
     def test_find_nearest_enemy_no_enemies(self):
         """Test _find_nearest_enemy() returns None when no enemies."""
-        robot1 = self.game.add_robot(1, 1000)
-        robot2 = self.game.add_robot(1, 1000)  # Same team
+        robot1 = place_robot(self.game, Robot(1, 5, 5, 1000))
+        place_robot(self.game, Robot(1, 6, 5, 1000))  # Same team
         
         nearest = self.game._find_nearest_enemy(robot1)
         self.assertIsNone(nearest)
@@ -255,7 +191,6 @@ class TestGameState(unittest.TestCase):
         robot2.set_position(5, 3)  # North of robot1
         
         direction = self.game._get_direction_to_nearest_enemy(robot1)
-        from robot_war.core.arena import Direction
         self.assertEqual(direction, Direction.N)
 
     def test_get_direction_to_nearest_enemy_no_enemy(self):
@@ -274,7 +209,6 @@ class TestGameState(unittest.TestCase):
         robot2.set_position(5, 3)  # North of robot1
         
         direction = self.game._get_direction_from_nearest_enemy(robot1)
-        from robot_war.core.arena import Direction
         self.assertEqual(direction, Direction.S)  # Move away (south)
 
     def test_get_direction_from_nearest_enemy_no_enemy(self):
@@ -314,27 +248,44 @@ class TestGameState(unittest.TestCase):
         self.assertTrue(result)  # Game continues
         self.assertEqual(robot1.energy, original_energy)  # No energy used
 
-    def test_robot_program_counter_advancement(self):
-        """Test robot program counter advances after instruction execution."""
+    def _start_program_counter_battle(self):
+        """Start a fresh two-robot battle where robot1 runs a three-step program."""
+        self.game = GameState(arena_width=10, arena_height=10, num_obstacles=0)
         robot1 = self.game.add_robot(1, 1000)
         robot2 = self.game.add_robot(2, 1000)  # Need 2 robots for game to continue
         robot1.program = ["RM", "IN", "MI"]
         robot2.program = ["RM"]
-        
         self.game.start_battle()
+        return robot1
+
+    def test_robot_program_counter_advancement(self):
+        """Test robot program counter advances after instruction execution."""
+        robot1 = self._start_program_counter_battle()
         self.assertEqual(robot1.program_counter, 0)
         
-        # Execute one turn
-        self.game.execute_turn()
-        self.assertEqual(robot1.program_counter, 1)
+        # (turns executed, expected counter) - the third turn wraps around
+        for turns, expected_counter in ((1, 1), (2, 2), (3, 0)):
+            with self.subTest(turns=turns):
+                robot1 = self._start_program_counter_battle()
+                for _ in range(turns):
+                    self.game.execute_turn()
+                self.assertEqual(robot1.program_counter, expected_counter)
+
+    def test_shared_tuple_program(self):
+        """Test robots can share one immutable program without it changing."""
+        shared_program = ("RM", "IN")
+        robot1 = self.game.add_robot(1, 1000)
+        robot2 = self.game.add_robot(2, 1000)
+        robot1.program = shared_program
+        robot2.program = shared_program
         
-        # Execute another turn
+        self.game.start_battle()
         self.game.execute_turn()
-        self.assertEqual(robot1.program_counter, 2)
-        
-        # Execute third turn (should wrap around)
         self.game.execute_turn()
-        self.assertEqual(robot1.program_counter, 0)
+        
+        self.assertEqual(shared_program, ("RM", "IN"))
+        self.assertEqual(robot1.program_counter, 0)  # Wrapped around the 2-step program
+        self.assertEqual(robot2.program_counter, 0)
 
     def test_frozen_robot_program_counter_not_advanced(self):
         """Test frozen robots don't advance program counter."""
@@ -352,5 +303,76 @@ class TestGameState(unittest.TestCase):
         self.assertEqual(robot1.program_counter, original_counter)  # Should not advance
 
 
+class TestGameStateQueries(unittest.TestCase):
+    """Test phase transitions and result queries that never touch the arena or robots."""
+
+    def setUp(self):
+        """Set up test game state."""
+        # No random obstacles
+        self.game = GameState(arena_width=10, arena_height=10, num_obstacles=0)
+
+    def test_start_programming_from_setup(self):
+        """Test transitioning from SETUP to PROGRAMMING phase."""
+        self.assertEqual(self.game.phase, GamePhase.SETUP)
+        self.game.start_programming()
+        self.assertEqual(self.game.phase, GamePhase.PROGRAMMING)
+
+    def test_start_programming_from_wrong_phase(self):
+        """Test start_programming() does nothing if not in SETUP phase."""
+        self.game.phase = GamePhase.BATTLE
+        self.game.start_programming()
+        self.assertEqual(self.game.phase, GamePhase.BATTLE)  # Should not change
+
+    def test_start_battle_from_setup(self):
+        """Test transitioning from SETUP to BATTLE phase."""
+        self.game.start_battle()
+        self.assertEqual(self.game.phase, GamePhase.BATTLE)
+        self.assertEqual(self.game.current_turn, 0)
+
+    def test_start_battle_from_programming(self):
+        """Test transitioning from PROGRAMMING to BATTLE phase."""
+        self.game.phase = GamePhase.PROGRAMMING
+        self.game.start_battle()
+        self.assertEqual(self.game.phase, GamePhase.BATTLE)
+        self.assertEqual(self.game.current_turn, 0)
+
+    def test_start_battle_from_wrong_phase(self):
+        """Test start_battle() does nothing if already in BATTLE or FINISHED."""
+        self.game.phase = GamePhase.FINISHED
+        original_turn = self.game.current_turn
+        self.game.start_battle()
+        self.assertEqual(self.game.phase, GamePhase.FINISHED)
+        self.assertEqual(self.game.current_turn, original_turn)
+
+    def test_execute_turn_wrong_phase(self):
+        """Test execute_turn() returns False if not in BATTLE phase."""
+        for phase in (GamePhase.SETUP, GamePhase.PROGRAMMING, GamePhase.FINISHED):
+            with self.subTest(phase=phase):
+                self.game.phase = phase
+                self.assertFalse(self.game.execute_turn())
+
+    def test_is_game_over_true(self):
+        """Test is_game_over() returns True when game finished."""
+        self.game.phase = GamePhase.FINISHED
+        self.assertTrue(self.game.is_game_over())
+
+    def test_is_game_over_false(self):
+        """Test is_game_over() returns False when game not finished."""
+        for phase in (GamePhase.SETUP, GamePhase.PROGRAMMING, GamePhase.BATTLE):
+            with self.subTest(phase=phase):
+                self.game.phase = phase
+                self.assertFalse(self.game.is_game_over())
+
+    def test_get_winner_with_winner(self):
+        """Test get_winner() returns winner ID."""
+        self.game.winner_id = 5
+        self.assertEqual(self.game.get_winner(), 5)
+
+    def test_get_winner_no_winner(self):
+        """Test get_winner() returns None when no winner."""
+        self.game.winner_id = None
+        self.assertIsNone(self.game.get_winner())
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Unit tests for instruction cost and damage tables."""
+
+import unittest
+from robot_war.core.instructions import InstructionSet, InstructionType
+
+
+class TestInstructionTables(unittest.TestCase):
+    """Test the int-indexed cost and damage tables cover every instruction type."""
+
+    def test_instruction_types_index_the_tables(self):
+        """Test instruction type values run 0..n-1 so they can index the tables directly."""
+        self.assertEqual([instruction_type.value for instruction_type in InstructionType],
+                         list(range(len(InstructionType))))
+
+    def test_every_instruction_type_has_a_cost_and_damage(self):
+        """Test every instruction type resolves to its configured energy cost and damage."""
+        for instruction_type in InstructionType:
+            with self.subTest(instruction=instruction_type.name):
+                self.assertIn(instruction_type, InstructionSet.ENERGY_COSTS)
+                self.assertEqual(InstructionSet.get_energy_cost(instruction_type),
+                                 InstructionSet.ENERGY_COSTS[instruction_type])
+                self.assertEqual(InstructionSet.get_damage(instruction_type),
+                                 InstructionSet.DAMAGE_VALUES.get(instruction_type, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
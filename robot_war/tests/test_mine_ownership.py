@@ -1,32 +1,13 @@
 """Unit tests for mine ownership and collision logic."""
 
 import unittest
-from robot_war.core.game_state import GameState
-from robot_war.core.robot import Robot, RobotStatus
+from robot_war.core.arena import Direction
+from robot_war.tests._fixtures import BaseTwoRobotTestCase, place_robot
 
 
-class TestMineOwnership(unittest.TestCase):
+class TestMineOwnership(BaseTwoRobotTestCase):
     """Test mine placement and ownership mechanics."""
 
-    def setUp(self):
-        """Set up test game state."""
-        self.game = GameState(arena_width=10, arena_height=10)
-        self.game.num_obstacles = 0  # No random obstacles for predictable tests
-        
-        # Add two robots at known positions
-        self.robot1 = self.game.add_robot(1, 1000)  # Player 1
-        self.robot2 = self.game.add_robot(2, 1000)  # Player 2
-        
-        # Set predictable positions
-        self.robot1.set_position(5, 5)
-        self.robot2.set_position(7, 5)
-        
-        # Update arena robot tracking
-        self.game.arena.robots = {
-            (5, 5): self.robot1,
-            (7, 5): self.robot2
-        }
-
     def test_mine_placement_creates_correct_id(self):
         """Test that mines are created with correct ownership ID."""
         # Robot 1 places mine
@@ -50,12 +31,9 @@ class TestMineOwnership(unittest.TestCase):
         
         # Robot 1 tries to move west (back onto its own mine)
         original_pos = self.robot1.get_position()
-        self.robot1.set_position(6, 5)  # Move away first
-        self.game.arena.robots[(6, 5)] = self.robot1
-        del self.game.arena.robots[(5, 5)]
+        place_robot(self.game, self.robot1, 6, 5)  # Move away first
         
         # Try to move back onto own mine
-        from robot_war.core.arena import Direction
         self.game._move_robot(self.robot1, Direction.W)
         
         # Robot should still be at (6, 5), blocked by own mine
@@ -70,7 +48,6 @@ class TestMineOwnership(unittest.TestCase):
         self.game._place_mine(self.robot1)
         
         # Move Robot 1 away from the mine
-        from robot_war.core.arena import Direction
         self.game._move_robot(self.robot1, Direction.N)  # Move Robot 1 from (5,5) to (5,4)
         
         # Robot 2 moves onto Robot 1's mine
@@ -97,19 +74,20 @@ class TestMineOwnership(unittest.TestCase):
         ]
         
         for player_id, expected_mine_id in test_cases:
-            # Place mine for player
-            self.game.arena.place_mine(0, player_id, player_id, 200)
-            
-            # Retrieve and check mine ID
-            mine_data = self.game.arena.trigger_mine(0, player_id)
-            self.assertIsNotNone(mine_data)
-            
-            mine_id, damage = mine_data
-            self.assertEqual(mine_id, expected_mine_id)
-            
-            # Decode ownership
-            decoded_owner = mine_id // 10
-            self.assertEqual(decoded_owner, player_id)
+            with self.subTest(player_id=player_id):
+                # Place mine for player
+                self.game.arena.place_mine(0, player_id, player_id, 200)
+                
+                # Retrieve and check mine ID
+                mine_data = self.game.arena.trigger_mine(0, player_id)
+                self.assertIsNotNone(mine_data)
+                
+                mine_id, damage = mine_data
+                self.assertEqual(mine_id, expected_mine_id)
+                
+                # Decode ownership
+                decoded_owner = mine_id // 10
+                self.assertEqual(decoded_owner, player_id)
 
 
 if __name__ == '__main__':
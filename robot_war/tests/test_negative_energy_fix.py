@@ -3,18 +3,27 @@
 import unittest
 from robot_war.core.robot import Robot, RobotStatus
 
+# (case, starting energy, hits as (damage, expected energy, expected status) applied in order)
+TAKE_DAMAGE_CASES = (
+    ("overkill", 50, ((100, 0, RobotStatus.DEAD),)),
+    ("multiple-hits", 100, ((60, 40, RobotStatus.ALIVE), (50, 0, RobotStatus.DEAD))),
+    ("exact-depletion", 100, ((100, 0, RobotStatus.DEAD),)),
+    ("damage-after-death", 100, ((150, 0, RobotStatus.DEAD), (50, 0, RobotStatus.DEAD))),
+)
+
 
 class TestNegativeEnergyFix(unittest.TestCase):
     """Test that robots cannot have negative energy values."""
 
     def test_take_damage_prevents_negative_energy(self):
-        """Test that take_damage prevents negative energy."""
-        robot = Robot(1, 5, 5, energy=50)
-        
-        robot.take_damage(100)
-        
-        self.assertEqual(robot.energy, 0)
-        self.assertEqual(robot.status, RobotStatus.DEAD)
+        """Test that take_damage clamps energy at 0 and kills the robot, however damage arrives."""
+        for case, energy, hits in TAKE_DAMAGE_CASES:
+            with self.subTest(case=case):
+                robot = Robot(1, 5, 5, energy=energy)
+                for damage, expected_energy, expected_status in hits:
+                    robot.take_damage(damage)
+                    self.assertEqual(robot.energy, expected_energy)
+                    self.assertEqual(robot.status, expected_status)
 
     def test_use_energy_prevents_negative_energy(self):
         """Test that use_energy prevents negative energy."""
@@ -26,38 +35,6 @@ class TestNegativeEnergyFix(unittest.TestCase):
         self.assertEqual(robot.energy, 0)
         self.assertEqual(robot.status, RobotStatus.DEAD)
 
-    def test_multiple_damage_applications(self):
-        """Test multiple damage applications don't create negative energy."""
-        robot = Robot(1, 5, 5, energy=100)
-        
-        robot.take_damage(60)
-        self.assertEqual(robot.energy, 40)
-        self.assertEqual(robot.status, RobotStatus.ALIVE)
-        
-        robot.take_damage(50)
-        self.assertEqual(robot.energy, 0)
-        self.assertEqual(robot.status, RobotStatus.DEAD)
-
-    def test_exact_energy_depletion(self):
-        """Test exact energy depletion works correctly."""
-        robot = Robot(1, 5, 5, energy=100)
-        
-        robot.take_damage(100)
-        self.assertEqual(robot.energy, 0)
-        self.assertEqual(robot.status, RobotStatus.DEAD)
-
-    def test_energy_cannot_go_below_zero_after_death(self):
-        """Test that energy stays at 0 even after robot is already dead."""
-        robot = Robot(1, 5, 5, energy=100)
-        
-        robot.take_damage(150)
-        self.assertEqual(robot.energy, 0)
-        self.assertEqual(robot.status, RobotStatus.DEAD)
-        
-        robot.take_damage(50)
-        self.assertEqual(robot.energy, 0)
-        self.assertEqual(robot.status, RobotStatus.DEAD)
-
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
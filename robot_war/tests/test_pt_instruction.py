@@ -4,30 +4,19 @@ import unittest
 from robot_war.core.game_state import GameState
 from robot_war.core.robot import Robot, RobotStatus
 from robot_war.core.instructions import InstructionSet, InstructionType
+from robot_war.tests._fixtures import BaseTwoRobotTestCase, place_robot
 
 
-class TestPTInstruction(unittest.TestCase):
+class TestPTInstruction(BaseTwoRobotTestCase):
     """Test PT (Proximity Test) conditional instruction mechanics."""
 
+    # Robot 2 south of robot 1 at center: close enough for proximity (distance = 2)
+    ROBOT2_POSITION = (5, 7)
+
     def setUp(self):
         """Set up test game state with known robot positions."""
-        self.game = GameState(arena_width=10, arena_height=10)
-        self.game.num_obstacles = 0  # No random obstacles for predictable tests
+        super().setUp()
         self.game.proximity_distance = 3  # Set known proximity distance
-        
-        # Add two robots at known positions
-        self.robot1 = self.game.add_robot(1, 1000)  # Player 1
-        self.robot2 = self.game.add_robot(2, 1000)  # Player 2
-        
-        # Set predictable positions: close enough for proximity (distance = 2)
-        self.robot1.set_position(5, 5)  # Robot 1 at center
-        self.robot2.set_position(5, 7)  # Robot 2 south of robot 1 (distance = 2)
-        
-        # Update arena robot tracking
-        self.game.arena.robots = {
-            (5, 5): self.robot1,
-            (5, 7): self.robot2
-        }
 
     def test_pt_instruction_parsing_valid(self):
         """Test PT instruction parsing with valid format."""
@@ -41,10 +30,11 @@ class TestPTInstruction(unittest.TestCase):
         ]
         
         for instruction_str, expected_actions in test_cases:
-            instruction = InstructionSet.parse_instruction(instruction_str)
-            self.assertIsNotNone(instruction)
-            self.assertEqual(instruction.type, InstructionType.PT)
-            self.assertEqual(instruction.parameter, expected_actions)
+            with self.subTest(instruction=instruction_str):
+                instruction = InstructionSet.parse_instruction(instruction_str)
+                self.assertIsNotNone(instruction)
+                self.assertEqual(instruction.type, InstructionType.PT)
+                self.assertEqual(instruction.parameter, expected_actions)
 
     def test_pt_instruction_parsing_invalid(self):
         """Test PT instruction parsing with invalid formats."""
@@ -58,8 +48,17 @@ class TestPTInstruction(unittest.TestCase):
         ]
         
         for invalid_str in invalid_cases:
-            instruction = InstructionSet.parse_instruction(invalid_str)
-            self.assertIsNone(instruction)
+            with self.subTest(instruction=invalid_str):
+                self.assertIsNone(InstructionSet.parse_instruction(invalid_str))
+
+    def test_pt_instruction_parsing_immutable(self):
+        """Test a parsed PT instruction is immutable, so later parses see the original actions."""
+        instruction = InstructionSet.parse_instruction("PT(DM(N),RM)")
+        with self.assertRaises(AttributeError):
+            instruction.parameter = ("FR", "FC")
+        
+        reparsed = InstructionSet.parse_instruction("PT(DM(N),RM)")
+        self.assertEqual(reparsed.parameter, ("DM(N)", "RM"))
 
     def test_pt_energy_cost(self):
         """Test PT instruction energy cost."""
@@ -75,8 +74,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_proximity_detection_false(self):
         """Test PT proximity detection when robots are far apart."""
         # Move robot2 far away (distance > proximity_distance)
-        self.robot2.set_position(0, 0)  # Distance from (5,5) = 10
-        self.game.arena.robots = {(5, 5): self.robot1, (0, 0): self.robot2}
+        place_robot(self.game, self.robot2, 0, 0)  # Distance from (5,5) = 10
         
         result = self.game._check_proximity(self.robot1)
         self.assertFalse(result)
@@ -131,8 +129,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_conditional_execution_false_branch(self):
         """Test PT executes second action when proximity test is false."""
         # Move robot2 far away to make proximity test false
-        self.robot2.set_position(0, 0)
-        self.game.arena.robots = {(5, 5): self.robot1, (0, 0): self.robot2}
+        place_robot(self.game, self.robot2, 0, 0)
         
         original_energy = self.robot1.energy
         original_mine_count = len(self.game.arena.mines)
@@ -197,8 +194,7 @@ class TestPTInstruction(unittest.TestCase):
         """Test PT at exact proximity distance boundary."""
         # Set robot2 at exactly proximity_distance away (within 10x10 grid bounds)
         self.game.proximity_distance = 4
-        self.robot2.set_position(5, 9)  # Distance = 4 (exactly at boundary, within grid)
-        self.game.arena.robots = {(5, 5): self.robot1, (5, 9): self.robot2}
+        place_robot(self.game, self.robot2, 5, 9)  # Distance = 4 (exactly at boundary, within grid)
         
         # At distance = proximity_distance, should detect (<=)
         result = self.game._check_proximity(self.robot1)
@@ -212,9 +208,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_multiple_nearby_robots(self):
         """Test PT with multiple robots in proximity."""
         # Add a third robot nearby
-        robot3 = self.game.add_robot(3, 1000)
-        robot3.set_position(3, 5)  # Distance from robot1 = 2
-        self.game.arena.robots[(3, 5)] = robot3
+        place_robot(self.game, Robot(3, 3, 5, 1000))  # Distance from robot1 = 2
         
         # Should detect proximity with multiple robots nearby
         result = self.game._check_proximity(self.robot1)
@@ -228,9 +222,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_with_fire_row_action(self):
         """Test PT with FR action when enemies are detected."""
         # Position robots for firing test
-        self.robot1.set_position(5, 5)
-        self.robot2.set_position(3, 5)  # Same row, within range
-        self.game.arena.robots = {(5, 5): self.robot1, (3, 5): self.robot2}
+        place_robot(self.game, self.robot2, 3, 5)  # Same row, within range
         
         original_target_energy = self.robot2.energy
         
@@ -245,9 +237,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_with_fire_column_action(self):
         """Test PT with FC action when enemies are detected."""
         # Position robots for firing test
-        self.robot1.set_position(5, 5)
-        self.robot2.set_position(5, 3)  # Same column, within range
-        self.game.arena.robots = {(5, 5): self.robot1, (5, 3): self.robot2}
+        place_robot(self.game, self.robot2, 5, 3)  # Same column, within range
         
         original_target_energy = self.robot2.energy
         
@@ -262,9 +252,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_fire_no_target_in_line(self):
         """Test PT fire actions when enemy detected but not in firing line."""
         # Position enemy nearby but not in row/column
-        self.robot1.set_position(5, 5)
-        self.robot2.set_position(3, 3)  # Diagonal, close enough for proximity
-        self.game.arena.robots = {(5, 5): self.robot1, (3, 3): self.robot2}
+        place_robot(self.game, self.robot2, 3, 3)  # Diagonal, close enough for proximity
         
         original_target_energy = self.robot2.energy
         
@@ -278,9 +266,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_proximity_blocked_by_obstacle(self):
         """Test PT proximity detection is blocked by obstacles."""
         # Setup: robot1 at (5,5), robot2 at (5,7), obstacle at (5,6) between them
-        self.robot1.set_position(5, 5)
-        self.robot2.set_position(5, 7)  # Distance = 2 (within proximity range of 3)
-        self.game.arena.robots = {(5, 5): self.robot1, (5, 7): self.robot2}
+        place_robot(self.game, self.robot2, 5, 7)  # Distance = 2 (within proximity range of 3)
         
         # Place obstacle between robots
         self.game.arena.place_obstacle(5, 6)
@@ -292,9 +278,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_proximity_clear_line_of_sight(self):
         """Test PT proximity detection works with clear line of sight."""
         # Setup: robot1 at (5,5), robot2 at (5,7), no obstacles between
-        self.robot1.set_position(5, 5)
-        self.robot2.set_position(5, 7)  # Distance = 2 (within proximity range of 3)
-        self.game.arena.robots = {(5, 5): self.robot1, (5, 7): self.robot2}
+        place_robot(self.game, self.robot2, 5, 7)  # Distance = 2 (within proximity range of 3)
         
         # Should detect with clear line of sight
         result = self.game._check_proximity(self.robot1)
@@ -303,9 +287,7 @@ class TestPTInstruction(unittest.TestCase):
     def test_pt_proximity_diagonal_blocked(self):
         """Test PT proximity detection blocked diagonally."""
         # Setup: robot1 at (5,5), robot2 at (7,7), obstacle at (6,6) between them
-        self.robot1.set_position(5, 5)
-        self.robot2.set_position(7, 7)  # Distance = 4 (within proximity range of 5)
-        self.game.arena.robots = {(5, 5): self.robot1, (7, 7): self.robot2}
+        place_robot(self.game, self.robot2, 7, 7)  # Distance = 4 (within proximity range of 5)
         self.game.proximity_distance = 5  # Increase range to test diagonal blocking
         
         # Place obstacle in diagonal path
@@ -317,15 +299,53 @@ class TestPTInstruction(unittest.TestCase):
 
     def test_line_of_sight_direct_method(self):
         """Test the line of sight method directly."""
-        # Clear path
-        self.assertTrue(self.game._has_line_of_sight(0, 0, 2, 0))  # Horizontal
-        self.assertTrue(self.game._has_line_of_sight(0, 0, 0, 2))  # Vertical
-        self.assertTrue(self.game._has_line_of_sight(0, 0, 2, 2))  # Diagonal
-        
-        # Place obstacle and test blocked paths
-        self.game.arena.place_obstacle(1, 0)
-        self.assertFalse(self.game._has_line_of_sight(0, 0, 2, 0))  # Blocked horizontal
-        self.assertTrue(self.game._has_line_of_sight(0, 0, 0, 2))   # Still clear vertical
+        # (case, endpoints, expected) - checked before and after placing an obstacle at (1,0)
+        clear_cases = (
+            ("horizontal", (0, 0, 2, 0), True),
+            ("vertical", (0, 0, 0, 2), True),
+            ("diagonal", (0, 0, 2, 2), True),
+        )
+        blocked_cases = (
+            ("blocked-horizontal", (0, 0, 2, 0), False),
+            ("still-clear-vertical", (0, 0, 0, 2), True),
+            ("blocked-in-reverse", (2, 0, 0, 0), False),
+        )
+        
+        # Every endpoint fits in a 3x3 arena, so the 10x10 robot fixture isn't needed
+        game = GameState(arena_width=3, arena_height=3, num_obstacles=0)
+        has_line_of_sight = game._has_line_of_sight
+        
+        for case, endpoints, expected in clear_cases:
+            with self.subTest(case=case):
+                self.assertEqual(has_line_of_sight(*endpoints), expected)
+        
+        game.arena.place_obstacle(1, 0)
+        for case, endpoints, expected in blocked_cases:
+            with self.subTest(case=case):
+                self.assertEqual(has_line_of_sight(*endpoints), expected)
+
+    def test_line_of_sight_symmetric_on_tie(self):
+        """Test both robots on an off-axis tie get the sight traced from the lower endpoint."""
+        game = GameState(arena_width=3, arena_height=3, num_obstacles=0)
+        game.arena.place_obstacle(1, 1)
+        
+        # The walk from (0,0) passes (1,0) and is clear; the walk from (2,1) would clip (1,1)
+        for endpoints in ((0, 0, 2, 1), (2, 1, 0, 0)):
+            with self.subTest(endpoints=endpoints):
+                self.assertTrue(game._has_line_of_sight(*endpoints))
+
+    def test_line_of_sight_symmetric_off_axis(self):
+        """Test every pair of cells sees each other equally around an obstacle cluster."""
+        game = GameState(arena_width=5, arena_height=5, num_obstacles=0)
+        for x, y in ((1, 1), (2, 3), (3, 2)):
+            game.arena.place_obstacle(x, y)
+        cells = [(x, y) for y in range(5) for x in range(5) if game.arena.is_passable(x, y)]
+        
+        for from_cell in cells:
+            for to_cell in cells:
+                with self.subTest(from_cell=from_cell, to_cell=to_cell):
+                    self.assertEqual(game._has_line_of_sight(*from_cell, *to_cell),
+                                     game._has_line_of_sight(*to_cell, *from_cell))
 
 
 if __name__ == '__main__':
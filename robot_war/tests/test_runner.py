@@ -0,0 +1,37 @@
+"""Unit tests for the headless battle runner."""
+
+import unittest
+from robot_war.core.game_state import GamePhase
+from robot_war.runner import create_ai_battle, run_battle
+
+
+class TestRunner(unittest.TestCase):
+    """Test running AI battles without the terminal UI."""
+
+    def test_create_ai_battle(self):
+        """Test AI battle setup applies configuration and programs every robot."""
+        game = create_ai_battle(num_robots=3, arena_size=12, max_turns=30, num_obstacles=5)
+        
+        self.assertEqual(len(game.robots), 3)
+        self.assertEqual((game.arena.width, game.arena.height), (12, 12))
+        self.assertEqual(game.max_turns, 30)
+        for robot in game.robots:
+            self.assertGreater(len(robot.program), 0)
+            self.assertIsNotNone(robot.emergency_action)
+
+    def test_run_battle_finishes(self):
+        """Test a battle runs to completion within the turn limit."""
+        game = create_ai_battle(num_robots=2, max_turns=20)
+        turns_seen = []
+        
+        winner_id = run_battle(game, on_turn=lambda state: turns_seen.append(state.current_turn))
+        
+        self.assertEqual(game.phase, GamePhase.FINISHED)
+        self.assertLessEqual(game.current_turn, 20)
+        self.assertEqual(turns_seen, list(range(len(turns_seen))))
+        if winner_id is not None:
+            self.assertIn(winner_id, [robot.player_id for robot in game.robots])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Unit tests for the parallel AI tournament runner."""
+
+import random
+import unittest
+from robot_war.ai.profiles import AIProfileLibrary
+from robot_war.tournament import run_match, run_tournament
+
+
+class TestTournament(unittest.TestCase):
+    """Test seeded matches and tournament aggregation."""
+
+    def test_run_match_reproducible(self):
+        """Test the same seed replays the same battle outcome."""
+        job = (7, 3, 15, 30, 10)
+        self.assertEqual(run_match(job), run_match(job))
+
+    def test_run_match_leaves_global_random_untouched(self):
+        """Test a seeded match draws from its own generator, not the global one."""
+        state = random.getstate()
+        run_match((7, 3, 15, 30, 10))
+        self.assertEqual(random.getstate(), state)
+
+    def test_run_match_winner_is_profile_name(self):
+        """Test match results name a library profile or report no winner."""
+        profile_names = {profile.name for profile in AIProfileLibrary.get_profiles().values()}
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                winner = run_match((seed, 2, 12, 20, 5))
+                self.assertTrue(winner is None or winner in profile_names)
+
+    def test_run_tournament_counts_every_game(self):
+        """Test the win table accounts for every battle played."""
+        wins = run_tournament(6, num_robots=2, arena_size=12, max_turns=20, num_obstacles=5,
+                              processes=2)
+        self.assertEqual(sum(wins.values()), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
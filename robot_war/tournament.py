@@ -0,0 +1,67 @@
+"""AI tournament - runs many independent headless battles across worker processes."""
+
+import argparse
+import multiprocessing
+import random
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from robot_war.runner import create_ai_battle, run_battle
+from robot_war.ai.profiles import AIProfileLibrary
+
+# (seed, num_robots, arena_size, max_turns, num_obstacles)
+MatchJob = Tuple[int, int, int, int, int]
+
+NO_WINNER = "no winner"
+
+
+def run_match(job: MatchJob) -> Optional[str]:
+    """Play one seeded AI battle. Returns the winning profile's name, or None."""
+    seed, num_robots, arena_size, max_turns, num_obstacles = job
+    rng = random.Random(seed)
+
+    profiles = AIProfileLibrary.get_balanced_team(num_robots, rng)
+    game = create_ai_battle(num_robots, arena_size, max_turns, num_obstacles, profiles=profiles,
+                            rng=rng)
+    winner_id = run_battle(game)
+
+    # Player IDs are assigned from 1 in profile order
+    return profiles[winner_id - 1].name if winner_id is not None else None
+
+
+def run_tournament(num_games: int, num_robots: int = 2, arena_size: int = 20, max_turns: int = 50,
+                   num_obstacles: int = 20, seed: int = 0,
+                   processes: Optional[int] = None) -> Dict[str, int]:
+    """Run num_games battles in parallel and count wins per profile name."""
+    jobs: List[MatchJob] = [(seed + game_number, num_robots, arena_size, max_turns, num_obstacles)
+                            for game_number in range(num_games)]
+
+    # Matches share no state, so each one runs in its own process outside the GIL
+    with multiprocessing.Pool(processes) as pool:
+        winners = Counter(winner or NO_WINNER for winner in pool.imap_unordered(run_match, jobs))
+
+    return dict(winners)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run an AI tournament from the command line and print the win table."""
+    parser = argparse.ArgumentParser(description="Run a Robot War AI tournament across CPU cores.")
+    parser.add_argument("--games", type=int, default=100, help="number of battles to run")
+    parser.add_argument("--robots", type=int, default=2, help="AI robots per battle")
+    parser.add_argument("--size", type=int, default=20, help="arena width and height")
+    parser.add_argument("--turns", type=int, default=50, help="maximum turns per battle")
+    parser.add_argument("--obstacles", type=int, default=20, help="obstacles per arena")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first battle")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    wins = run_tournament(args.games, args.robots, args.size, args.turns, args.obstacles,
+                          args.seed, args.processes)
+
+    for name, count in sorted(wins.items(), key=lambda item: item[1], reverse=True):
+        print(f"{name:<12} {count:>5}")
+
+
+if __name__ == "__main__":
+    main()
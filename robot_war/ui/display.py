@@ -54,7 +54,7 @@ class ArenaDisplay:
         if game_state.combat_log:
             lines.append("")
             lines.append(f"{Colors.COMBAT}🔥 Combat Actions:{Style.RESET_ALL}")
-            for log_entry in game_state.combat_log:
+            for log_entry in game_state.get_combat_log_lines():
                 lines.append(f"{Colors.COMBAT}{log_entry}{Style.RESET_ALL}")
 
         return "\n".join(lines)
@@ -271,7 +271,7 @@ class RichArenaDisplay:
         layout["robot_status"].update(self.create_robot_status_panel(game_state.robots))
         
         # Footer - Combat log
-        layout["footer"].update(self.create_combat_log_panel(game_state.combat_log))
+        layout["footer"].update(self.create_combat_log_panel(game_state.get_combat_log_lines()))
         
         return layout
     